@@ -10,11 +10,17 @@ Run locally:
     modal run modal/abodybuilder_app.py::predict_structure --vh-seq "EVQL..." --vl-seq "DIQM..."
 """
 
+import os
+
 import modal
 
 # Create Modal app
 app = modal.App("abodybuilder2-cd3")
 
+# GPU type, chosen at deploy time (e.g. ABODYBUILDER_GPU=T4 modal deploy ...).
+# L4 has fp16 tensor cores and ~2x the memory bandwidth of T4.
+ABODYBUILDER_GPU = os.environ.get("ABODYBUILDER_GPU", "L4")
+
 # Define container image with ABodyBuilder2 dependencies
 abodybuilder_image = (
     modal.Image.debian_slim(python_version="3.10")
@@ -26,19 +32,54 @@ abodybuilder_image = (
         "scipy",
     )
     .pip_install("ImmuneBuilder")
+    # Opt in at deploy time with ABODYBUILDER_COMPILE=1 modal deploy ...
+    .env({
+        "ABODYBUILDER_COMPILE": os.environ.get("ABODYBUILDER_COMPILE", "0"),
+        "ABODYBUILDER_GPU": ABODYBUILDER_GPU,
+    })
 )
 
+# ABodyBuilder2 instance, loaded once per container and reused by later calls
+_model = None
+
+
+def get_model():
+    """Load ABodyBuilder2 on first use and keep it resident in the container.
+
+    With ABODYBUILDER_COMPILE=1, each of the four structure modules is wrapped
+    in torch.compile (reduce-overhead mode, which uses CUDA graphs). Shapes vary
+    with Fv length, so this only pays off for long-lived containers.
+    """
+    global _model
+    if _model is None:
+        import torch
+        from ImmuneBuilder import ABodyBuilder2
+
+        # Allow TF32 tensor-core matmuls/convolutions (no-op on pre-Ampere GPUs)
+        torch.set_float32_matmul_precision("high")
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+
+        model = ABodyBuilder2()
+        if os.environ.get("ABODYBUILDER_COMPILE") == "1":
+            for name, module in model.models.items():
+                model.models[name] = torch.compile(module, mode="reduce-overhead", dynamic=True)
+        _model = model
+    return _model
+
 
 @app.function(
     image=abodybuilder_image,
-    gpu="T4",  # T4 is sufficient for antibody structure prediction
+    gpu=ABODYBUILDER_GPU,
     timeout=600,  # 10 min timeout
     retries=2,
+    max_containers=32,  # fan-out limit for predict_structure_batch
 )
 def predict_structure(
     vh_sequence: str,
     vl_sequence: str = None,
     num_recycles: int = 3,
+    mixed_precision: bool = False,
 ) -> dict:
     """Predict antibody Fv structure.
 
@@ -46,19 +87,20 @@ def predict_structure(
         vh_sequence: VH (or VHH) sequence.
         vl_sequence: VL sequence (optional, None for VHH).
         num_recycles: Number of recycling iterations.
+        mixed_precision: Run the forward pass under fp16 autocast.
 
     Returns:
         Dictionary with prediction results.
     """
+    import contextlib
     import tempfile
-    import os
     from pathlib import Path
 
-    try:
-        from ImmuneBuilder import ABodyBuilder2
+    import torch
 
-        # Load model
-        model = ABodyBuilder2()
+    try:
+        # Load model (cached after the first call in this container)
+        model = get_model()
 
         # Prepare sequences
         if vl_sequence:
@@ -67,7 +109,13 @@ def predict_structure(
             sequences = {"H": vh_sequence}
 
         # Run prediction
-        output = model.predict(sequences)
+        autocast = (
+            torch.autocast("cuda", dtype=torch.float16)
+            if mixed_precision and torch.cuda.is_available()
+            else contextlib.nullcontext()
+        )
+        with autocast:
+            output = model.predict(sequences)
 
         # Save to temp file and read back
         with tempfile.NamedTemporaryFile(suffix=".pdb", delete=False) as f:
@@ -99,38 +147,43 @@ def predict_structure(
 
 @app.function(
     image=abodybuilder_image,
-    gpu="T4",
     timeout=3600,  # 1 hour for batch
 )
 def predict_structure_batch(
     sequences: list[dict],  # [{"vh": "...", "vl": "..."}, ...]
     num_recycles: int = 3,
+    mixed_precision: bool = False,
 ) -> list[dict]:
     """Predict structures for multiple antibodies.
 
+    Each antibody is an independent predict_structure call, fanned out across
+    GPU containers with .map().
+
     Args:
         sequences: List of dicts with "vh" and optional "vl" keys.
         num_recycles: Number of recycling iterations.
+        mixed_precision: Run each forward pass under fp16 autocast.
 
     Returns:
-        List of prediction results.
+        List of prediction results, in input order.
     """
     results = []
 
-    for seq_dict in sequences:
-        try:
-            result = predict_structure.local(
-                vh_sequence=seq_dict["vh"],
-                vl_sequence=seq_dict.get("vl"),
-                num_recycles=num_recycles,
-            )
-            results.append(result)
-        except Exception as e:
+    outputs = predict_structure.map(
+        [seq_dict["vh"] for seq_dict in sequences],
+        [seq_dict.get("vl") for seq_dict in sequences],
+        kwargs={"num_recycles": num_recycles, "mixed_precision": mixed_precision},
+        return_exceptions=True,
+    )
+    for seq_dict, result in zip(sequences, outputs):
+        if isinstance(result, Exception):
             results.append({
-                "error": str(e),
+                "error": str(result),
                 "vh_sequence": seq_dict["vh"],
                 "vl_sequence": seq_dict.get("vl"),
             })
+        else:
+            results.append(result)
 
     return results
 
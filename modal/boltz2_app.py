@@ -1,7 +1,9 @@
 """Boltz-2 Modal deployment for complex structure prediction.
 
 This module provides a Modal app for running Boltz-2
-on GPU infrastructure for protein complex prediction.
+on GPU infrastructure for protein complex prediction. Inference runs
+in-process in a warm `Boltz2Model` container; the module-level functions
+are thin callers kept for existing clients.
 
 Deploy with:
     modal deploy modal/boltz2_app.py
@@ -10,27 +12,93 @@ Run locally:
     modal run modal/boltz2_app.py --binder-seq "EVQL..." --target-seq "DGNE..."
 """
 
+import gzip
+import hashlib
 import json
+import os
+import re
 import shutil
-import subprocess
+import tempfile
 from pathlib import Path
 from typing import Optional
 
 import modal
 
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:  # download_image ships without numpy/numba
+    njit = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    HAVE_SCIPY = False
+else:
+    HAVE_SCIPY = True
+
 MINUTES = 60
 
+# Below this many atoms on the smaller side, a brute-force compiled loop
+# beats KD-tree construction
+NUMBA_CONTACT_MAX_ATOMS = 2000
+
+# Block size for _contacts_numpy; see src.structure.pdb_utils.CONTACT_CHUNK_ELEMENTS
+CONTACT_CHUNK_ELEMENTS = 1 << 16
+
 app = modal.App("boltz2-cd3")
 
 # Container with Boltz-2
-image = modal.Image.debian_slim(python_version="3.12").pip_install(
-    "boltz==2.1.1",
+image = (
+    modal.Image.debian_slim(python_version="3.12")
+    .pip_install("boltz==2.1.1")
+    .env({
+        "NUMBA_CACHE_DIR": "/root/.numba_cache",
+        "BOLTZ_TMPDIR": "/dev/shm",
+        # Warm containers see a different complex size every call; growable
+        # segments keep the caching allocator from fragmenting between them
+        "PYTORCH_CUDA_ALLOC_CONF": "expandable_segments:True",
+        # Opt in at deploy time with BOLTZ_KERNEL_TUNING=1 modal deploy ...
+        "BOLTZ_KERNEL_TUNING": os.environ.get("BOLTZ_KERNEL_TUNING", "0"),
+    })
 )
 
-# Persistent volume for model weights
+# Persistent volume for model weights (populated by download_model; inference
+# reads the copy baked into the image below)
 boltz_model_volume = modal.Volume.from_name("boltz-models", create_if_missing=True)
 models_dir = Path("/models/boltz")
 
+# Boltz-2 weights baked into the image layer, so cold starts read them from
+# local disk instead of the network-attached volume
+weights_dir = Path("/root/.boltz_cache")
+
+
+def bake_boltz_weights():
+    """Download Boltz-2 weights and CCD molecules into the image at build time."""
+    from boltz.main import download_boltz2
+
+    weights_dir.mkdir(parents=True, exist_ok=True)
+    download_boltz2(weights_dir)
+
+
+image = image.run_function(bake_boltz_weights)
+
+# Content-addressed cache of finished predictions, keyed by sequence(s), seed and MSA mode
+results_cache_volume = modal.Volume.from_name("boltz2-results-cache", create_if_missing=True)
+results_cache_dir = Path("/cache/boltz2")
+
+# tmpfs scratch space for per-call boltz inputs/outputs (set via the image env)
+SCRATCH_DIR = os.environ.get("BOLTZ_TMPDIR", "/dev/shm")
+
+# Below this much free space in SCRATCH_DIR, scratch falls back to the default temp dir
+SCRATCH_MIN_FREE_BYTES = 1 << 30
+
+# ColabFold MSA server used when use_msa=True
+MSA_SERVER_URL = "https://api.colabfold.com"
+
+# Binders per Boltz2Model call when predict_complex_batch fans out across GPUs
+BATCH_SHARD_SIZE = 8
+
 # Image for downloading model
 download_image = (
     modal.Image.debian_slim()
@@ -39,62 +107,77 @@ download_image = (
 )
 
 
+AA_3TO1 = {
+    "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
+    "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
+    "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
+    "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
+}
+
+# ATOM record for one chain: residue name (cols 18-20), residue number (23-26),
+# insertion code (27, may be absent on truncated lines). The chain ID is filled
+# in per call so other chains are skipped inside the regex engine. Anchored on
+# a literal newline rather than ^ so the engine can use its fast prefix search;
+# callers prepend "\n" so the first line also matches.
+ATOM_RESIDUE_PATTERN = r"\nATOM.{13}(.{3}).%s(.{4})(.?)"
+
+
 def parse_pdb_sequence(pdb_content: str, chain_id: str = "A") -> str:
     """Extract amino acid sequence from PDB content."""
-    aa_3to1 = {
-        "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
-        "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
-        "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
-        "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
-    }
+    pattern = re.compile(ATOM_RESIDUE_PATTERN % re.escape(chain_id))
+    residues = {}
+
+    # dict.fromkeys drops repeated atoms of the same residue in C, keeping first-seen order
+    matches = dict.fromkeys(pattern.findall("\n" + pdb_content))
+    for res_name, res_num, insertion_code in matches:
+        aa = AA_3TO1.get(res_name)
+        if aa is None:
+            continue
+        residues.setdefault((int(res_num), insertion_code or " ", res_name), aa)
 
-    sequence = []
-    seen_residues = set()
+    # Stable sort keeps first-seen order for residues sharing (number, insertion code)
+    return "".join(residues[key] for key in sorted(residues, key=lambda k: (k[0], k[1])))
 
-    for line in pdb_content.split("\n"):
-        if line.startswith("ATOM"):
-            chain = line[21]
-            if chain != chain_id:
-                continue
 
-            res_name = line[17:20].strip()
-            res_num = int(line[22:26])
-            insertion_code = line[26] if len(line) > 26 else " "
-            res_key = (res_num, insertion_code, res_name)
+YAML_HEADER = "version: 1\nsequences:\n"
+YAML_CHAIN = "  - protein:\n      id: %s\n      sequence: %s\n"
+YAML_NO_MSA = "      msa: empty\n"
+YAML_MSA_PATH = "      msa: %s\n"
 
-            if res_key not in seen_residues and res_name in aa_3to1:
-                seen_residues.add(res_key)
-                sequence.append((res_num, insertion_code, aa_3to1[res_name]))
-
-    sequence.sort(key=lambda x: (x[0], x[1]))
-    return "".join([aa for _, _, aa in sequence])
 
+def build_yaml(
+    sequences: dict[str, str],
+    use_msa: bool = False,
+    msa_paths: Optional[dict[str, str]] = None,
+) -> str:
+    """Build Boltz YAML input from sequences dict.
 
-def build_yaml(sequences: dict[str, str], use_msa: bool = False) -> str:
-    """Build Boltz YAML input from sequences dict."""
-    lines = ["version: 1", "sequences:"]
-    for chain_id, seq in sequences.items():
-        lines.extend([
-            "  - protein:",
-            f"      id: {chain_id}",
-            f"      sequence: {seq}",
-        ])
-        if not use_msa:
-            lines.append("      msa: empty")
-    return "\n".join(lines)
+    Chains listed in msa_paths use that precomputed MSA file; the others get an
+    MSA from the server (use_msa) or none.
+    """
+    msa_paths = msa_paths or {}
+    default_msa = "" if use_msa else YAML_NO_MSA
+    return YAML_HEADER + "".join(
+        YAML_CHAIN % (chain_id, seq)
+        + (YAML_MSA_PATH % msa_paths[chain_id] if chain_id in msa_paths else default_msa)
+        for chain_id, seq in sequences.items()
+    )
 
 
-def parse_mmcif_atoms(cif_content: str) -> list[dict]:
-    """Parse ATOM records from mmCIF format.
+def parse_mmcif_atoms(cif_content: str) -> dict:
+    """Parse ATOM records from mmCIF format into coordinate arrays.
 
-    Returns list of dicts with keys: chain, res_num, x, y, z
+    Returns dict of arrays with keys: chain (str), res_num (int32), xyz (float32, N x 3)
     """
-    atoms = []
+    chains = []
+    res_nums = []
+    coords = []
     lines = cif_content.split("\n")
 
     # Find the _atom_site loop header
     in_atom_site = False
     column_names = []
+    data_start = None
 
     for i, line in enumerate(lines):
         line = line.strip()
@@ -111,38 +194,39 @@ def parse_mmcif_atoms(cif_content: str) -> list[dict]:
             column_names.append(col_name)
             continue
 
-        # If we were reading column headers and hit data, process it
+        # First data row after the column headers
         if in_atom_site and column_names and not line.startswith("_"):
-            if not line or line.startswith("#"):
-                break
-
-            # Get column indices we need
-            try:
-                chain_idx = column_names.index("label_asym_id")
-            except ValueError:
-                chain_idx = column_names.index("auth_asym_id") if "auth_asym_id" in column_names else None
-
-            try:
-                seq_idx = column_names.index("label_seq_id")
-            except ValueError:
-                seq_idx = column_names.index("auth_seq_id") if "auth_seq_id" in column_names else None
-
-            x_idx = column_names.index("Cartn_x") if "Cartn_x" in column_names else None
-            y_idx = column_names.index("Cartn_y") if "Cartn_y" in column_names else None
-            z_idx = column_names.index("Cartn_z") if "Cartn_z" in column_names else None
-            group_idx = column_names.index("group_PDB") if "group_PDB" in column_names else None
-
-            if None in [chain_idx, seq_idx, x_idx, y_idx, z_idx]:
-                break
-
-            # Now parse this line and remaining ATOM lines
-            for data_line in lines[i:]:
-                data_line = data_line.strip()
-                if not data_line or data_line.startswith("#") or data_line.startswith("_") or data_line.startswith("loop_"):
-                    break
+            if line and not line.startswith("#"):
+                data_start = i
+            break
 
+    if data_start is not None:
+        # Resolve column indices once per loop header, before the data-row loop.
+        # Explicit None checks: column 0 is a valid index.
+        idx = {name: i for i, name in enumerate(column_names)}
+        chain_idx = idx.get("label_asym_id")
+        if chain_idx is None:
+            chain_idx = idx.get("auth_asym_id")
+        seq_idx = idx.get("label_seq_id")
+        if seq_idx is None:
+            seq_idx = idx.get("auth_seq_id")
+        x_idx = idx.get("Cartn_x")
+        y_idx = idx.get("Cartn_y")
+        z_idx = idx.get("Cartn_z")
+        group_idx = idx.get("group_PDB")
+
+        if None not in (chain_idx, seq_idx, x_idx, y_idx, z_idx):
+            max_idx = max(chain_idx, seq_idx, x_idx, y_idx, z_idx)
+
+            for data_line in lines[data_start:]:
                 parts = data_line.split()
-                if len(parts) <= max(chain_idx, seq_idx, x_idx, y_idx, z_idx):
+                if not parts:
+                    break
+                first = parts[0]
+                if first[0] in "#_" or first.startswith("loop_"):
+                    break
+
+                if len(parts) <= max_idx:
                     continue
 
                 # Only process ATOM records (not HETATM)
@@ -150,17 +234,232 @@ def parse_mmcif_atoms(cif_content: str) -> list[dict]:
                     continue
 
                 try:
-                    chain = parts[chain_idx]
-                    res_num = int(parts[seq_idx]) if parts[seq_idx] != "." else 0
-                    x = float(parts[x_idx])
-                    y = float(parts[y_idx])
-                    z = float(parts[z_idx])
-                    atoms.append({"chain": chain, "res_num": res_num, "x": x, "y": y, "z": z})
-                except (ValueError, IndexError):
+                    seq = parts[seq_idx]
+                    res_num = int(seq) if seq != "." else 0
+                    xyz = (float(parts[x_idx]), float(parts[y_idx]), float(parts[z_idx]))
+                except ValueError:
                     continue
-            break
+                chains.append(parts[chain_idx])
+                res_nums.append(res_num)
+                coords.append(xyz)
+
+    return {
+        "chain": np.asarray(chains, dtype=object),
+        "res_num": np.asarray(res_nums, dtype=np.int32),
+        "xyz": np.asarray(coords, dtype=np.float32).reshape(-1, 3),
+    }
+
+
+ATOM_RECORD_TAG = int.from_bytes(b"ATOM", "little")
+
+
+def parse_pdb_atoms(pdb_content: str) -> dict:
+    """Parse ATOM records from PDB format into coordinate arrays.
+
+    Vectorised fixed-width reader: ATOM line offsets are found on the raw byte
+    buffer, the 54 leading columns of every record are gathered into one
+    (N, 54) byte matrix, and coordinate/residue columns are converted in bulk.
+    Falls back to a per-line parse if any record has malformed fields.
+
+    Returns dict of arrays with keys: chain (str), res_num (int32), xyz (float32, N x 3)
+    """
+    data = pdb_content.encode()
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+
+    # ATOM records long enough to hold coordinates (columns 31-54)
+    starts = starts[(ends - starts) >= 54]
+    # Record name compared as one little-endian uint32 per line instead of 4 bytes
+    head = buf[starts[:, None] + np.arange(4)].view("<u4").ravel()
+    starts = starts[head == ATOM_RECORD_TAG]
+    records = buf[starts[:, None] + np.arange(54)]
+
+    def column(lo: int, hi: int):
+        return np.ascontiguousarray(records[:, lo:hi]).view(f"S{hi - lo}").ravel()
+
+    try:
+        xyz = np.stack(
+            [column(30, 38), column(38, 46), column(46, 54)], axis=1
+        ).astype(np.float32)
+        res_nums = column(22, 26).astype(np.int32)
+    except ValueError:
+        return _parse_pdb_atoms_by_line(data)
+
+    return {
+        "chain": column(21, 22).astype("U1"),
+        "res_num": res_nums,
+        "xyz": xyz.reshape(-1, 3),
+    }
+
+
+def _parse_pdb_atoms_by_line(data: bytes) -> dict:
+    """Per-line PDB ATOM parse that skips records whose fields do not parse."""
+    n_max = data.count(b"\nATOM") + data.startswith(b"ATOM")
+    chains = np.empty(n_max, dtype="U1")
+    res_nums = np.empty(n_max, dtype=np.int32)
+    coords = np.empty((n_max, 3), dtype=np.float32)
+
+    n = 0
+    for line in data.split(b"\n"):
+        if not line.startswith(b"ATOM") or len(line) < 54:
+            continue
+        try:
+            coords[n, 0] = float(line[30:38])
+            coords[n, 1] = float(line[38:46])
+            coords[n, 2] = float(line[46:54])
+            res_nums[n] = int(line[22:26])
+        except ValueError:
+            continue
+        chains[n] = chr(line[21])
+        n += 1
+
+    return {"chain": chains[:n], "res_num": res_nums[:n], "xyz": coords[:n]}
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _contacts_numba(xb, xt, cutoff_sq):
+        """All-pairs contact kernel returning (binder_idx, target_idx) atom pairs."""
+        n = xb.shape[0]
+        m = xt.shape[0]
+
+        # First pass: count contacts per binder atom so output can be preallocated
+        counts = np.zeros(n, dtype=np.int64)
+        for i in prange(n):
+            c = 0
+            for j in range(m):
+                dx = xb[i, 0] - xt[j, 0]
+                dy = xb[i, 1] - xt[j, 1]
+                dz = xb[i, 2] - xt[j, 2]
+                if dx * dx + dy * dy + dz * dz <= cutoff_sq:
+                    c += 1
+            counts[i] = c
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        binder_idx = np.empty(offsets[n], dtype=np.int64)
+        target_idx = np.empty(offsets[n], dtype=np.int64)
+
+        # Second pass: write pairs into each atom's slice
+        for i in prange(n):
+            k = offsets[i]
+            for j in range(m):
+                dx = xb[i, 0] - xt[j, 0]
+                dy = xb[i, 1] - xt[j, 1]
+                dz = xb[i, 2] - xt[j, 2]
+                if dx * dx + dy * dy + dz * dz <= cutoff_sq:
+                    binder_idx[k] = i
+                    target_idx[k] = j
+                    k += 1
+
+        return binder_idx, target_idx
+
+
+def _contacts_numpy(binder_xyz, target_xyz, cutoff_sq: float):
+    """Blocked NumPy contact search, used when neither scipy nor numba is available.
+
+    Copy of src.structure.pdb_utils._find_atom_contacts: the Modal image does
+    not ship the src package (its __init__ pulls in the whole pipeline).
+    """
+    target_t = target_xyz.astype(np.float32).T.copy()
+    rows = max(1, CONTACT_CHUNK_ELEMENTS // len(target_t[0]))
+    binder_idx = []
+    target_idx = []
+    for start in range(0, len(binder_xyz), rows):
+        block = binder_xyz[start:start + rows].astype(np.float32, copy=False)
+        dist_sq = block[:, 0:1] - target_t[0]
+        dist_sq *= dist_sq
+        for axis in (1, 2):
+            diff = block[:, axis:axis + 1] - target_t[axis]
+            diff *= diff
+            dist_sq += diff
+        i, j = np.nonzero(dist_sq <= cutoff_sq)
+        binder_idx.append(i + start)
+        target_idx.append(j)
+    return np.concatenate(binder_idx), np.concatenate(target_idx)
+
+
+def find_contact_pairs(binder_xyz, target_xyz, distance_cutoff: float = 5.0):
+    """Find binder/target atom pairs within a distance cutoff.
+
+    Small complexes use a compiled all-pairs loop (numba); larger ones build a
+    KD-tree over each side and query neighbours within the cutoff, so only
+    close pairs are materialised (no N x M distance matrix). Without scipy,
+    the numba loop handles every size, and without numba either, a chunked
+    NumPy distance computation is used.
+
+    Args:
+        binder_xyz: (N, 3) array of binder atom coordinates.
+        target_xyz: (M, 3) array of target atom coordinates.
+        distance_cutoff: Distance cutoff in Angstroms.
+
+    Returns:
+        Tuple of (binder_idx, target_idx) integer arrays, one entry per atom pair.
+    """
+    if len(binder_xyz) == 0 or len(target_xyz) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    small = min(len(binder_xyz), len(target_xyz)) < NUMBA_CONTACT_MAX_ATOMS
+    if njit is not None and (small or not HAVE_SCIPY):
+        return _contacts_numba(
+            np.ascontiguousarray(binder_xyz, dtype=np.float32),
+            np.ascontiguousarray(target_xyz, dtype=np.float32),
+            np.float32(distance_cutoff) ** 2,
+        )
+
+    if not HAVE_SCIPY:
+        return _contacts_numpy(binder_xyz, target_xyz, np.float32(distance_cutoff) ** 2)
+
+    binder_tree = cKDTree(binder_xyz)
+    target_tree = cKDTree(target_xyz)
+    pairs = binder_tree.sparse_distance_matrix(
+        target_tree, distance_cutoff, output_type="ndarray"
+    )
+    return pairs["i"], pairs["j"]
+
+
+def warmup_contact_kernel():
+    """Compile the numba contact kernel at image build so calls skip JIT cost."""
+    xyz = np.zeros((2, 3), dtype=np.float32)
+    find_contact_pairs(xyz, xyz)
+
+
+image = image.run_function(warmup_contact_kernel)
 
-    return atoms
+
+def summarize_contacts(binder_keys, target_res, binder_idx, target_idx):
+    """Collapse atom-level contacts into residue-level contacts.
+
+    Residues are compacted to dense indices (np.unique) and marked in a boolean
+    (binder residue x target residue) contact matrix, so duplicate atom pairs
+    collapse without hashing and residue numbering may be sparse or negative.
+
+    Args:
+        binder_keys: Per-atom binder residue keys, shape (N,) or (N, k) for
+            composite keys such as (chain code, residue number).
+        target_res: Per-atom target residue numbers, shape (M,).
+        binder_idx: Binder atom index of each contacting atom pair.
+        target_idx: Target atom index of each contacting atom pair.
+
+    Returns:
+        Tuple of (num_contacts, binder_residue_keys, target_residues) where the
+        residue arrays hold the unique keys that take part in any contact.
+    """
+    binder_ids, binder_inv = np.unique(binder_keys, axis=0, return_inverse=True)
+    target_ids, target_inv = np.unique(target_res, return_inverse=True)
+
+    contact = np.zeros((len(binder_ids), len(target_ids)), dtype=bool)
+    contact[binder_inv.reshape(-1)[binder_idx], target_inv.reshape(-1)[target_idx]] = True
+
+    return (
+        int(contact.sum()),
+        binder_ids[contact.any(axis=1)],
+        target_ids[contact.any(axis=0)],
+    )
 
 
 def calculate_interface_metrics(
@@ -170,58 +469,31 @@ def calculate_interface_metrics(
     distance_cutoff: float = 5.0,
 ) -> dict:
     """Calculate interface metrics from predicted complex structure."""
-    binder_atoms = []
-    target_atoms = []
-    binder_residues = set()
-    target_residues = set()
-
-    # Try mmCIF format first (Boltz-2 outputs mmCIF)
+    # Try mmCIF format first (Boltz-2 outputs mmCIF), fall back to PDB format
     if "_atom_site." in cif_or_pdb:
         atoms = parse_mmcif_atoms(cif_or_pdb)
-        for atom in atoms:
-            if atom["chain"] == binder_chain:
-                binder_atoms.append((atom["res_num"], atom["x"], atom["y"], atom["z"]))
-            elif atom["chain"] == target_chain:
-                target_atoms.append((atom["res_num"], atom["x"], atom["y"], atom["z"]))
     else:
-        # Fall back to PDB format
-        for line in cif_or_pdb.split("\n"):
-            if not line.startswith("ATOM"):
-                continue
+        atoms = parse_pdb_atoms(cif_or_pdb)
 
-            if len(line) >= 54 and line[30:38].strip().replace(".", "").replace("-", "").isdigit():
-                chain = line[21]
-                try:
-                    x = float(line[30:38])
-                    y = float(line[38:46])
-                    z = float(line[46:54])
-                    res_num = int(line[22:26])
-                except (ValueError, IndexError):
-                    continue
-
-                if chain == binder_chain:
-                    binder_atoms.append((res_num, x, y, z))
-                elif chain == target_chain:
-                    target_atoms.append((res_num, x, y, z))
+    binder_mask = atoms["chain"] == binder_chain
+    target_mask = (atoms["chain"] == target_chain) & ~binder_mask
+    binder_res = atoms["res_num"][binder_mask]
+    binder_xyz = atoms["xyz"][binder_mask]
+    target_res = atoms["res_num"][target_mask]
+    target_xyz = atoms["xyz"][target_mask]
 
     # Find contacts - count unique residue pairs
-    contact_pairs = set()
-    cutoff_sq = distance_cutoff ** 2
-
-    for res_b, xb, yb, zb in binder_atoms:
-        for res_t, xt, yt, zt in target_atoms:
-            dist_sq = (xb - xt) ** 2 + (yb - yt) ** 2 + (zb - zt) ** 2
-            if dist_sq <= cutoff_sq:
-                contact_pairs.add((res_b, res_t))
-                binder_residues.add(res_b)
-                target_residues.add(res_t)
+    binder_idx, target_idx = find_contact_pairs(binder_xyz, target_xyz, distance_cutoff)
+    num_contacts, binder_residues, target_residues = summarize_contacts(
+        binder_res, target_res, binder_idx, target_idx
+    )
 
     interface_area = (len(binder_residues) + len(target_residues)) * 80.0
 
     return {
-        "num_contacts": len(contact_pairs),
-        "interface_residues_binder": sorted(binder_residues),
-        "interface_residues_target": sorted(target_residues),
+        "num_contacts": num_contacts,
+        "interface_residues_binder": binder_residues.tolist(),
+        "interface_residues_target": target_residues.tolist(),
         "interface_area": interface_area,
     }
 
@@ -247,54 +519,33 @@ def calculate_interface_metrics_multichain(
         Dict with num_contacts, interface_residues_binder, interface_residues_target,
         interface_area.
     """
-    binder_atoms = []
-    target_atoms = []
-    binder_residues = set()
-    target_residues = set()
-    binder_chain_set = set(binder_chains)
-
     if "_atom_site." in cif_or_pdb:
         atoms = parse_mmcif_atoms(cif_or_pdb)
-        for atom in atoms:
-            if atom["chain"] in binder_chain_set:
-                binder_atoms.append((atom["chain"], atom["res_num"], atom["x"], atom["y"], atom["z"]))
-            elif atom["chain"] == target_chain:
-                target_atoms.append((atom["res_num"], atom["x"], atom["y"], atom["z"]))
     else:
-        for line in cif_or_pdb.split("\n"):
-            if not line.startswith("ATOM"):
-                continue
-            if len(line) >= 54 and line[30:38].strip().replace(".", "").replace("-", "").isdigit():
-                chain = line[21]
-                try:
-                    x = float(line[30:38])
-                    y = float(line[38:46])
-                    z = float(line[46:54])
-                    res_num = int(line[22:26])
-                except (ValueError, IndexError):
-                    continue
-                if chain in binder_chain_set:
-                    binder_atoms.append((chain, res_num, x, y, z))
-                elif chain == target_chain:
-                    target_atoms.append((res_num, x, y, z))
-
-    contact_pairs = set()
-    cutoff_sq = distance_cutoff ** 2
-
-    for chain_b, res_b, xb, yb, zb in binder_atoms:
-        for res_t, xt, yt, zt in target_atoms:
-            dist_sq = (xb - xt) ** 2 + (yb - yt) ** 2 + (zb - zt) ** 2
-            if dist_sq <= cutoff_sq:
-                contact_pairs.add((chain_b, res_b, res_t))
-                binder_residues.add((chain_b, res_b))
-                target_residues.add(res_t)
+        atoms = parse_pdb_atoms(cif_or_pdb)
+
+    binder_mask = np.isin(atoms["chain"], list(binder_chains))
+    target_mask = (atoms["chain"] == target_chain) & ~binder_mask
+    binder_res = atoms["res_num"][binder_mask]
+    binder_xyz = atoms["xyz"][binder_mask]
+    target_res = atoms["res_num"][target_mask]
+    target_xyz = atoms["xyz"][target_mask]
+
+    # Encode binder chain IDs as small integers so (chain, residue) keys stay numeric
+    _, binder_chain_codes = np.unique(atoms["chain"][binder_mask], return_inverse=True)
+    binder_chain_codes = binder_chain_codes.astype(np.int32)
+
+    binder_idx, target_idx = find_contact_pairs(binder_xyz, target_xyz, distance_cutoff)
+    num_contacts, binder_residues, target_residues = summarize_contacts(
+        np.stack([binder_chain_codes, binder_res], axis=1), target_res, binder_idx, target_idx
+    )
 
     interface_area = (len(binder_residues) + len(target_residues)) * 80.0
 
     return {
-        "num_contacts": len(contact_pairs),
-        "interface_residues_binder": sorted([r for _, r in binder_residues]),
-        "interface_residues_target": sorted(target_residues),
+        "num_contacts": num_contacts,
+        "interface_residues_binder": sorted(binder_residues[:, 1].tolist()),
+        "interface_residues_target": target_residues.tolist(),
         "interface_area": interface_area,
     }
 
@@ -305,81 +556,107 @@ def calculate_interface_metrics_multichain(
     image=download_image,
 )
 def download_model(force_download: bool = False):
-    """Download Boltz-2 model weights to Modal volume."""
+    """Download Boltz-2 model weights to Modal volume.
+
+    Optional: Boltz2Model uses the weights baked into the image at build time.
+    """
     from huggingface_hub import snapshot_download
 
+    if (models_dir / "boltz2_conf.ckpt").exists() and not force_download:
+        print(f"Model already present in {models_dir}")
+        return
+
+    # Checkpoints plus the mols archive; skips READMEs and other repo files
     snapshot_download(
         repo_id="boltz-community/boltz-2",
         local_dir=models_dir,
+        allow_patterns=["*.ckpt", "*.tar"],
         force_download=force_download,
+        max_workers=16,
     )
     boltz_model_volume.commit()
     print(f"Model downloaded to {models_dir}")
 
 
-@app.function(
-    image=image,
-    volumes={models_dir: boltz_model_volume},
-    timeout=10 * MINUTES,
-    gpu="H100",
-)
-def predict_complex(
+def scratch_root() -> Optional[str]:
+    """Parent for per-call scratch dirs: SCRATCH_DIR if it has room, else None (default temp dir).
+
+    Containers can mount a small /dev/shm, so tmpfs is only used while it has
+    at least SCRATCH_MIN_FREE_BYTES free.
+    """
+    try:
+        free = shutil.disk_usage(SCRATCH_DIR).free
+    except OSError:
+        return None
+    if free < SCRATCH_MIN_FREE_BYTES:
+        print(f"Only {free >> 20} MiB free in {SCRATCH_DIR}; using disk scratch")
+        return None
+    return SCRATCH_DIR
+
+
+def result_cache_key(*parts) -> str:
+    """SHA-256 key for a prediction request (sequences, seed, use_msa)."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def load_cached_result(key: str) -> Optional[dict]:
+    """Load a cached prediction result, or None on a cache miss."""
+    path = results_cache_dir / key[:2] / f"{key}.json.gz"
+    if not path.exists():
+        return None
+    with gzip.open(path, "rt") as f:
+        return json.load(f)
+
+
+def store_cached_result(key: str, result: dict) -> None:
+    """Write a prediction result (gzipped JSON, CIF included) to the cache."""
+    path = results_cache_dir / key[:2] / f"{key}.json.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wt") as f:
+        json.dump(result, f)
+    tmp_path.replace(path)
+
+
+def cached_target_msa(target_sequence: str) -> Path:
+    """Unpaired MSA for a target, computed once and kept on the results cache volume.
+
+    Every binder in a screen shares the target, so its ColabFold query runs once
+    per target sequence instead of once per prediction. Binder chains still get
+    their MSA from the server inside process_inputs.
+    """
+    from boltz.main import compute_msa
+
+    key = result_cache_key("msa", target_sequence)
+    path = results_cache_dir / "msa" / f"{key}.csv"
+    if path.exists():
+        return path
+
+    print(f"Computing target MSA ({len(target_sequence)} aa)")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=scratch_root()) as tmp:
+        compute_msa(
+            data={"target": target_sequence},
+            target_id="target",
+            msa_dir=Path(tmp),
+            msa_server_url=MSA_SERVER_URL,
+            msa_pairing_strategy="greedy",
+        )
+        tmp_path = path.with_suffix(".tmp")
+        shutil.copyfile(Path(tmp) / "target.csv", tmp_path)
+    tmp_path.replace(path)
+    results_cache_volume.commit()
+    return path
+
+
+def build_complex_result(
+    cif_content: str,
+    confidence: dict,
     binder_sequence: str,
     target_sequence: str,
-    use_msa: bool = False,
-    seed: int = 42,
+    seed: int,
 ) -> dict:
-    """Predict binder-target complex structure.
-
-    Args:
-        binder_sequence: Binder amino acid sequence.
-        target_sequence: Target amino acid sequence.
-        use_msa: Whether to use MSA server (slower but may be more accurate).
-        seed: Random seed.
-
-    Returns:
-        Dictionary with prediction results.
-    """
-    # Clean up old results directories to avoid reading stale outputs
-    for old_dir in Path(".").glob("boltz_results_*"):
-        shutil.rmtree(old_dir, ignore_errors=True)
-
-    # Build YAML input - target is chain A, binder is chain B
-    yaml_content = build_yaml({"A": target_sequence, "B": binder_sequence}, use_msa=use_msa)
-
-    input_path = Path("input.yaml")
-    input_path.write_text(yaml_content)
-
-    cmd = [
-        "boltz", "predict", str(input_path),
-        "--cache", str(models_dir),
-        "--accelerator", "gpu",
-        "--seed", str(seed),
-    ]
-    if use_msa:
-        cmd.append("--use_msa_server")
-
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"STDERR: {result.stderr}")
-        raise RuntimeError(f"Boltz-2 prediction failed: {result.stderr}")
-
-    # Find outputs - should only be one directory now after cleanup
-    results_dirs = list(Path(".").glob("boltz_results_*"))
-    if not results_dirs:
-        raise RuntimeError("No boltz_results directory found after prediction")
-    results_dir = results_dirs[0]
-    pred_dir = list((results_dir / "predictions").iterdir())[0]
-
-    cif_file = list(pred_dir.glob("*_model_0.cif"))[0]
-    conf_file = list(pred_dir.glob("confidence_*.json"))[0]
-
-    cif_content = cif_file.read_text()
-    confidence = json.loads(conf_file.read_text())
-
-    # Calculate interface metrics
+    """Assemble the 2-chain prediction result dict (target A, binder B)."""
     interface = calculate_interface_metrics(cif_content, binder_chain="B", target_chain="A")
 
     return {
@@ -399,11 +676,337 @@ def predict_complex(
     }
 
 
-@app.function(
+@app.cls(
     image=image,
-    volumes={models_dir: boltz_model_volume},
-    timeout=10 * MINUTES,
+    volumes={results_cache_dir: results_cache_volume},
+    timeout=120 * MINUTES,
     gpu="H100",
+    max_containers=8,
+)
+class Boltz2Model:
+    """Boltz-2 kept resident in a warm container.
+
+    Weights are loaded once per container in `load`; each method call then
+    runs preprocessing and inference in-process instead of spawning
+    `boltz predict`, so repeated and batched calls skip model load and CUDA init.
+    """
+
+    @modal.enter()
+    def load(self):
+        """Load Boltz-2 weights and configure torch once per container."""
+        from dataclasses import asdict
+
+        import torch
+        from boltz.main import (
+            Boltz2DiffusionParams,
+            BoltzSteeringParams,
+            MSAModuleArgs,
+            PairformerArgsV2,
+            download_boltz2,
+        )
+        from boltz.model.models.boltz2 import Boltz2
+        from rdkit import Chem
+
+        # Same process-level settings as `boltz predict`, except fp32 matmuls
+        # may use TF32 tensor cores (the Trainer already runs bf16-mixed)
+        torch.set_grad_enabled(False)
+        torch.set_float32_matmul_precision("high")
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        Chem.SetDefaultPickleProperties(Chem.PropertyPickleOptions.AllProps)
+        if os.environ.get("BOLTZ_KERNEL_TUNING") != "1":
+            # `boltz predict` default: fixed cuequivariance kernel configs. With
+            # tuning on, triangle kernels are autotuned for the first shapes seen
+            # (slow first call, faster repeats for the same target/binder sizes).
+            os.environ["CUEQ_DEFAULT_CONFIG"] = "1"
+            os.environ["CUEQ_DISABLE_AOT_TUNING"] = "1"
+
+        # No-op when the baked weights are present
+        download_boltz2(weights_dir)
+        self.mol_dir = weights_dir / "mols"
+
+        diffusion_params = Boltz2DiffusionParams()
+        diffusion_params.step_scale = 1.5
+        steering_args = BoltzSteeringParams()
+        steering_args.fk_steering = False
+        steering_args.guidance_update = False
+
+        self.model = Boltz2.load_from_checkpoint(
+            weights_dir / "boltz2_conf.ckpt",
+            strict=True,
+            # `boltz predict` CLI defaults
+            predict_args={
+                "recycling_steps": 3,
+                "sampling_steps": 200,
+                "diffusion_samples": 1,
+                "max_parallel_samples": 5,
+                "write_confidence_summary": True,
+                "write_full_pae": False,
+                "write_full_pde": False,
+            },
+            map_location="cpu",
+            diffusion_process_args=asdict(diffusion_params),
+            ema=False,
+            use_kernels=True,
+            pairformer_args=asdict(PairformerArgsV2()),
+            msa_args=asdict(
+                MSAModuleArgs(subsample_msa=True, num_subsampled_msa=1024, use_paired_feature=True)
+            ),
+            steering_args=asdict(steering_args),
+        )
+        self.model.eval()
+
+    def run_jobs(
+        self,
+        jobs: dict[str, dict[str, str]],
+        seeds: dict[str, int],
+        use_msa: bool = False,
+        msa_paths: Optional[dict[str, str]] = None,
+    ) -> dict[str, tuple[str, dict]]:
+        """Run several Boltz-2 inputs through the resident model.
+
+        The RNGs are reseeded with each job's own seed right before its
+        prediction, so a job's output does not depend on which other jobs share
+        the batch or where it sits in it.
+
+        Args:
+            jobs: Mapping of job name to chain sequences (chain ID -> sequence).
+            seeds: Mapping of job name to random seed.
+            use_msa: Whether to use MSA server.
+            msa_paths: Precomputed MSA file per chain ID, shared by all jobs.
+
+        Returns:
+            Mapping of job name to (cif_content, confidence) for jobs that produced output.
+        """
+        from boltz.data.module.inferencev2 import Boltz2InferenceDataModule
+        from boltz.data.types import Manifest
+        from boltz.data.write.writer import BoltzWriter
+        from boltz.main import process_inputs
+        from pytorch_lightning import Callback, Trainer, seed_everything
+
+        class ReseedPerRecord(Callback):
+            # The inference data module yields one record per batch
+            def on_predict_batch_start(
+                self, trainer, pl_module, batch, batch_idx, dataloader_idx=0
+            ):
+                seed_everything(seeds[batch["record"][0].id], verbose=False)
+
+        # Per-call scratch directory on tmpfs: inputs, processed features and
+        # predictions never touch disk, and nothing stale survives between calls
+        with tempfile.TemporaryDirectory(dir=scratch_root()) as tmp:
+            work_dir = Path(tmp)
+            input_dir = work_dir / "inputs"
+            out_dir = work_dir / "results"
+            input_dir.mkdir(parents=True)
+
+            input_paths = []
+            for name, sequences in jobs.items():
+                path = input_dir / f"{name}.yaml"
+                path.write_text(build_yaml(sequences, use_msa=use_msa, msa_paths=msa_paths))
+                input_paths.append(path)
+
+            process_inputs(
+                data=input_paths,
+                out_dir=out_dir,
+                ccd_path=weights_dir / "ccd.pkl",
+                mol_dir=self.mol_dir,
+                use_msa_server=use_msa,
+                msa_server_url=MSA_SERVER_URL,
+                msa_pairing_strategy="greedy",
+                boltz2=True,
+            )
+
+            processed_dir = out_dir / "processed"
+            manifest = Manifest.load(processed_dir / "manifest.json")
+            if not manifest.records:
+                raise RuntimeError("Boltz-2 preprocessing produced no valid inputs")
+
+            data_module = Boltz2InferenceDataModule(
+                manifest=manifest,
+                target_dir=processed_dir / "structures",
+                msa_dir=processed_dir / "msa",
+                mol_dir=self.mol_dir,
+                num_workers=2,
+                constraints_dir=processed_dir / "constraints",
+                template_dir=processed_dir / "templates",
+                extra_mols_dir=processed_dir / "mols",
+            )
+            writer = BoltzWriter(
+                data_dir=processed_dir / "structures",
+                output_dir=out_dir / "predictions",
+                output_format="mmcif",
+                boltz2=True,
+            )
+            trainer = Trainer(
+                default_root_dir=out_dir,
+                callbacks=[ReseedPerRecord(), writer],
+                accelerator="gpu",
+                devices=1,
+                precision="bf16-mixed",
+                logger=False,
+            )
+
+            print(f"Running Boltz-2 on {len(manifest.records)} inputs")
+            trainer.predict(self.model, datamodule=data_module, return_predictions=False)
+
+            outputs = {}
+            for name in jobs:
+                pred_dir = out_dir / "predictions" / name
+                cif_files = list(pred_dir.glob("*_model_0.cif"))
+                conf_files = list(pred_dir.glob("confidence_*.json"))
+                if not cif_files or not conf_files:
+                    continue
+                outputs[name] = (cif_files[0].read_text(), json.loads(conf_files[0].read_text()))
+            return outputs
+
+    @modal.method()
+    def predict_complexes(
+        self,
+        binder_sequences: list[str],
+        seeds: list[int],
+        target_sequence: str,
+        use_msa: bool = False,
+    ) -> list[dict]:
+        """Predict complexes for several binders against one target in one pass.
+
+        Each binder is predicted with its own entry in seeds. Results already in
+        the cache volume are returned without running the model. Binders whose
+        prediction produced no output get an error dict in their slot.
+        """
+        results_cache_volume.reload()
+        # With MSA on, the target uses the cached unpaired MSA; keyed apart from
+        # results predicted with a per-complex paired target MSA
+        msa_mode = "target-msa" if use_msa else False
+        keys = [
+            result_cache_key(seq, target_sequence, seed, msa_mode)
+            for seq, seed in zip(binder_sequences, seeds)
+        ]
+        results = [load_cached_result(key) for key in keys]
+
+        jobs = {
+            f"binder_{i:04d}": {"A": target_sequence, "B": seq}
+            for i, seq in enumerate(binder_sequences)
+            if results[i] is None
+        }
+        print(f"Result cache: {len(binder_sequences) - len(jobs)} hits, {len(jobs)} misses")
+        if not jobs:
+            return results
+        msa_paths = {"A": str(cached_target_msa(target_sequence))} if use_msa else None
+        outputs = self.run_jobs(
+            jobs,
+            {f"binder_{i:04d}": seed for i, seed in enumerate(seeds)},
+            use_msa=use_msa,
+            msa_paths=msa_paths,
+        )
+
+        for i, seq in enumerate(binder_sequences):
+            name = f"binder_{i:04d}"
+            if name not in jobs:
+                continue
+            if name not in outputs:
+                results[i] = {
+                    "error": "No Boltz-2 prediction output found",
+                    "binder_sequence": seq,
+                    "seed": seeds[i],
+                }
+                continue
+            cif_content, confidence = outputs[name]
+            results[i] = build_complex_result(
+                cif_content, confidence, seq, target_sequence, seeds[i]
+            )
+            store_cached_result(keys[i], results[i])
+
+        results_cache_volume.commit()
+        return results
+
+    @modal.method()
+    def predict_multichain(
+        self,
+        vh_sequence: str,
+        vl_sequence: str,
+        target_sequence: str,
+        use_msa: bool = False,
+        seed: int = 42,
+    ) -> dict:
+        """Predict 3-chain complex: target (A) + VH (B) + VL (C)."""
+        results_cache_volume.reload()
+        msa_mode = "target-msa" if use_msa else False
+        key = result_cache_key("3chain", vh_sequence, vl_sequence, target_sequence, seed, msa_mode)
+        cached = load_cached_result(key)
+        if cached is not None:
+            return cached
+
+        outputs = self.run_jobs(
+            {"complex_3chain": {"A": target_sequence, "B": vh_sequence, "C": vl_sequence}},
+            {"complex_3chain": seed},
+            use_msa=use_msa,
+            msa_paths={"A": str(cached_target_msa(target_sequence))} if use_msa else None,
+        )
+        if "complex_3chain" not in outputs:
+            raise RuntimeError("No Boltz-2 3-chain prediction output found")
+        cif_content, confidence = outputs["complex_3chain"]
+
+        # Calculate interface metrics: union of chains B+C (binder) vs chain A (target)
+        interface = calculate_interface_metrics_multichain(
+            cif_content, binder_chains=["B", "C"], target_chain="A"
+        )
+
+        result = {
+            "cif_string": cif_content,
+            "vh_sequence": vh_sequence,
+            "vl_sequence": vl_sequence,
+            "target_sequence": target_sequence,
+            "prediction_mode": "3chain",
+            "pdockq": confidence.get("pdockq", 0.0),
+            "ptm": confidence.get("ptm", 0.0),
+            "plddt_mean": confidence.get("complex_plddt", 0.0),
+            "ipae": confidence.get("ipae", 0.0),
+            "iptm": confidence.get("protein_iptm", 0.0),
+            "num_contacts": interface["num_contacts"],
+            "interface_residues_binder": interface["interface_residues_binder"],
+            "interface_residues_target": interface["interface_residues_target"],
+            "interface_area": interface["interface_area"],
+            "seed": seed,
+        }
+        store_cached_result(key, result)
+        results_cache_volume.commit()
+        return result
+
+
+@app.function(
+    image=image,
+    # Covers Boltz2Model queueing, cold start and its own 120-minute budget
+    timeout=120 * MINUTES,
+)
+def predict_complex(
+    binder_sequence: str,
+    target_sequence: str,
+    use_msa: bool = False,
+    seed: int = 42,
+) -> dict:
+    """Predict binder-target complex structure.
+
+    Args:
+        binder_sequence: Binder amino acid sequence.
+        target_sequence: Target amino acid sequence.
+        use_msa: Whether to use MSA server (slower but may be more accurate).
+        seed: Random seed.
+
+    Returns:
+        Dictionary with prediction results.
+    """
+    # Target is chain A, binder is chain B
+    result = Boltz2Model().predict_complexes.remote(
+        [binder_sequence], [seed], target_sequence, use_msa=use_msa
+    )[0]
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result
+
+
+@app.function(
+    image=image,
+    timeout=120 * MINUTES,
 )
 def predict_complex_multichain(
     vh_sequence: str,
@@ -429,76 +1032,14 @@ def predict_complex_multichain(
         Dictionary with prediction results including interface metrics
         computed by unioning chains B+C as binder vs chain A as target.
     """
-    # Clean up old results directories
-    for old_dir in Path(".").glob("boltz_results_*"):
-        shutil.rmtree(old_dir, ignore_errors=True)
-
-    # Build 3-chain YAML: A=target, B=VH, C=VL
-    yaml_content = build_yaml(
-        {"A": target_sequence, "B": vh_sequence, "C": vl_sequence},
-        use_msa=use_msa,
-    )
-
-    input_path = Path("input.yaml")
-    input_path.write_text(yaml_content)
-
-    cmd = [
-        "boltz", "predict", str(input_path),
-        "--cache", str(models_dir),
-        "--accelerator", "gpu",
-        "--seed", str(seed),
-    ]
-    if use_msa:
-        cmd.append("--use_msa_server")
-
-    print(f"Running 3-chain: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"STDERR: {result.stderr}")
-        raise RuntimeError(f"Boltz-2 3-chain prediction failed: {result.stderr}")
-
-    results_dirs = list(Path(".").glob("boltz_results_*"))
-    if not results_dirs:
-        raise RuntimeError("No boltz_results directory found after prediction")
-    results_dir = results_dirs[0]
-    pred_dir = list((results_dir / "predictions").iterdir())[0]
-
-    cif_file = list(pred_dir.glob("*_model_0.cif"))[0]
-    conf_file = list(pred_dir.glob("confidence_*.json"))[0]
-
-    cif_content = cif_file.read_text()
-    confidence = json.loads(conf_file.read_text())
-
-    # Calculate interface metrics: union of chains B+C (binder) vs chain A (target)
-    interface = calculate_interface_metrics_multichain(
-        cif_content, binder_chains=["B", "C"], target_chain="A"
+    return Boltz2Model().predict_multichain.remote(
+        vh_sequence, vl_sequence, target_sequence, use_msa=use_msa, seed=seed
     )
 
-    return {
-        "cif_string": cif_content,
-        "vh_sequence": vh_sequence,
-        "vl_sequence": vl_sequence,
-        "target_sequence": target_sequence,
-        "prediction_mode": "3chain",
-        "pdockq": confidence.get("pdockq", 0.0),
-        "ptm": confidence.get("ptm", 0.0),
-        "plddt_mean": confidence.get("complex_plddt", 0.0),
-        "ipae": confidence.get("ipae", 0.0),
-        "iptm": confidence.get("protein_iptm", 0.0),
-        "num_contacts": interface["num_contacts"],
-        "interface_residues_binder": interface["interface_residues_binder"],
-        "interface_residues_target": interface["interface_residues_target"],
-        "interface_area": interface["interface_area"],
-        "seed": seed,
-    }
-
 
 @app.function(
     image=image,
-    volumes={models_dir: boltz_model_volume},
-    timeout=10 * MINUTES,
-    gpu="H100",
+    timeout=120 * MINUTES,
 )
 def predict_complex_from_pdb(
     binder_sequence: str,
@@ -524,11 +1065,45 @@ def predict_complex_from_pdb(
     return predict_complex.local(binder_sequence, target_sequence, use_msa=use_msa, seed=seed)
 
 
+def predict_sharded(
+    binder_sequences: list[str],
+    seeds: list[int],
+    target_sequence: str,
+    use_msa: bool = False,
+) -> list[dict]:
+    """Fan binders out over Boltz2Model containers in shards of BATCH_SHARD_SIZE.
+
+    Each shard is one batched predict_complexes call; shards run in parallel
+    (up to the class's max_containers). Binder i is predicted with seeds[i]
+    whichever shard it lands in. A failed shard yields an error dict for each
+    of its binders, so the output always lines up with the input.
+    """
+    starts = range(0, len(binder_sequences), BATCH_SHARD_SIZE)
+    shards = [binder_sequences[i:i + BATCH_SHARD_SIZE] for i in starts]
+    seed_shards = [seeds[i:i + BATCH_SHARD_SIZE] for i in starts]
+
+    results = []
+    outputs = Boltz2Model().predict_complexes.map(
+        shards,
+        seed_shards,
+        kwargs={"target_sequence": target_sequence, "use_msa": use_msa},
+        return_exceptions=True,
+    )
+    for shard, shard_seeds, shard_results in zip(shards, seed_shards, outputs):
+        if isinstance(shard_results, Exception):
+            results.extend(
+                {"error": str(shard_results), "binder_sequence": seq, "seed": seed}
+                for seq, seed in zip(shard, shard_seeds)
+            )
+        else:
+            results.extend(shard_results)
+
+    return results
+
+
 @app.function(
     image=image,
-    volumes={models_dir: boltz_model_volume},
     timeout=120 * MINUTES,
-    gpu="H100",
 )
 def predict_complex_batch(
     binder_sequences: list[str],
@@ -538,42 +1113,26 @@ def predict_complex_batch(
 ) -> list[dict]:
     """Predict complexes for multiple binders.
 
+    Binders are split into shards of BATCH_SHARD_SIZE that run in parallel
+    across GPU containers (see predict_sharded).
+
     Args:
         binder_sequences: List of binder sequences.
         target_sequence: Target sequence.
         use_msa: Whether to use MSA server.
-        seed: Base random seed.
+        seed: Base random seed (binder i uses seed + i).
 
     Returns:
         List of prediction results.
     """
-    results = []
-
-    for i, seq in enumerate(binder_sequences):
-        print(f"Predicting {i+1}/{len(binder_sequences)}...")
-        try:
-            result = predict_complex.local(
-                binder_sequence=seq,
-                target_sequence=target_sequence,
-                use_msa=use_msa,
-                seed=seed + i,
-            )
-            results.append(result)
-        except Exception as e:
-            results.append({
-                "error": str(e),
-                "binder_sequence": seq,
-                "seed": seed + i,
-            })
-
-    return results
+    print(f"Predicting {len(binder_sequences)} binders...")
+    seeds = [seed + i for i in range(len(binder_sequences))]
+    return predict_sharded(binder_sequences, seeds, target_sequence, use_msa=use_msa)
 
 
 @app.function(
     image=image,
-    volumes={models_dir: boltz_model_volume},
     timeout=60 * MINUTES,
-    gpu="H100",
 )
 def run_calibration(
     known_binder_sequences: list[str],
@@ -589,56 +1148,54 @@ def run_calibration(
         known_binder_sequences: List of known binder sequences.
         target_sequence: Target sequence.
         use_msa: Whether to use MSA server.
-        seed: Random seed.
+        seed: Base random seed (binder i uses seed + i).
 
     Returns:
         Calibration results with recommended thresholds.
     """
+    print(f"Calibrating with {len(known_binder_sequences)} known binders...")
     results = []
-
-    for i, seq in enumerate(known_binder_sequences):
-        print(f"Calibrating with binder {i+1}/{len(known_binder_sequences)}...")
-        try:
-            result = predict_complex.local(
-                binder_sequence=seq,
-                target_sequence=target_sequence,
-                use_msa=use_msa,
-                seed=seed + i,
-            )
+    seeds = [seed + i for i in range(len(known_binder_sequences))]
+    batch = predict_sharded(known_binder_sequences, seeds, target_sequence, use_msa=use_msa)
+    for i, result in enumerate(batch):
+        if "error" in result:
+            print(f"Warning: Calibration failed for sequence {i}: {result['error']}")
+        else:
             results.append(result)
-        except Exception as e:
-            print(f"Warning: Calibration failed for sequence {i}: {e}")
 
     if not results:
         raise RuntimeError("Calibration failed - no successful predictions")
 
-    # Calculate thresholds
-    pdockq_values = [r["pdockq"] for r in results if "pdockq" in r]
-    area_values = [r["interface_area"] for r in results if "interface_area" in r]
-    contact_values = [r["num_contacts"] for r in results if "num_contacts" in r]
+    # Calculate thresholds: one (N, 3) array of pdockq, interface_area, num_contacts,
+    # reduced column-wise in a single pass per statistic
+    stats = np.array(
+        [[r["pdockq"], r["interface_area"], r["num_contacts"]] for r in results],
+        dtype=np.float64,
+    )
+    mins, maxs, means = stats.min(axis=0), stats.max(axis=0), stats.mean(axis=0)
 
     return {
         "known_binder_results": results,
         "calibrated_thresholds": {
-            "min_pdockq": max(0.0, min(pdockq_values) - 0.05) if pdockq_values else 0.0,
-            "min_interface_area": max(0.0, min(area_values) - 100) if area_values else 0.0,
-            "min_contacts": max(0, min(contact_values) - 2) if contact_values else 0,
+            "min_pdockq": max(0.0, float(mins[0]) - 0.05),
+            "min_interface_area": max(0.0, float(mins[1]) - 100),
+            "min_contacts": max(0, int(mins[2]) - 2),
         },
         "known_binder_stats": {
             "pdockq": {
-                "min": min(pdockq_values) if pdockq_values else 0,
-                "max": max(pdockq_values) if pdockq_values else 0,
-                "mean": sum(pdockq_values) / len(pdockq_values) if pdockq_values else 0,
+                "min": float(mins[0]),
+                "max": float(maxs[0]),
+                "mean": float(means[0]),
             },
             "interface_area": {
-                "min": min(area_values) if area_values else 0,
-                "max": max(area_values) if area_values else 0,
-                "mean": sum(area_values) / len(area_values) if area_values else 0,
+                "min": float(mins[1]),
+                "max": float(maxs[1]),
+                "mean": float(means[1]),
             },
             "contacts": {
-                "min": min(contact_values) if contact_values else 0,
-                "max": max(contact_values) if contact_values else 0,
-                "mean": sum(contact_values) / len(contact_values) if contact_values else 0,
+                "min": int(mins[2]),
+                "max": int(maxs[2]),
+                "mean": float(means[2]),
             },
         },
     }
@@ -20,35 +20,137 @@ Run locally:
 
 from __future__ import annotations
 
+import collections
+import csv
+import functools
 import json
+import os
+import re
+import shutil
+import signal
 import subprocess
+import threading
 from pathlib import Path
 
 import modal
 
 MINUTES = 60
 
+# Lines of CLI output kept in memory for error messages (the rest is only logged)
+OUTPUT_TAIL_LINES = 200
+
 app = modal.App("boltzgen-cd3")
 
+# GPU types for run_boltzgen/run_boltzgen_fab in order of preference; Modal
+# falls back to the next type when the first has no capacity
+BOLTZGEN_GPUS = ["H100", "A100"]
+
+# Local-disk copy of models_dir used as BoltzGen's --cache, made once per
+# container (set BOLTZGEN_LOCAL_CACHE="" at deploy time to read the volume directly)
+LOCAL_CACHE_DIR = os.environ.get("BOLTZGEN_LOCAL_CACHE", "/tmp/boltzgen-cache")
+
 # Container with BoltzGen - install from GitHub main for latest fixes
 # (PyPI 0.2.0 is from Dec 10, but refolding fix landed Dec 17)
 boltzgen_image = (
     modal.Image.debian_slim(python_version="3.11")
     .apt_install("git")
-    .pip_install("boltzgen @ git+https://github.com/HannesStark/boltzgen.git@main")
+    .pip_install("boltzgen @ git+https://github.com/HannesStark/boltzgen.git@main", "gemmi")
+    .env({
+        "BOLTZGEN_LOCAL_CACHE": LOCAL_CACHE_DIR,
+        # Let the boltzgen CLI's fp32 matmuls use TF32 tensor cores (torch reads
+        # this at startup; equivalent to allow_tf32 for every cuBLAS call)
+        "TORCH_ALLOW_TF32_CUBLAS_OVERRIDE": "1",
+    })
 )
 
 # Persistent volume for model weights
 boltzgen_model_volume = modal.Volume.from_name("boltzgen-models", create_if_missing=True)
 models_dir = Path("/models/boltzgen")
 
+# Fab scaffold YAML+CIF pairs written by bake_scaffolds, one subdirectory per scaffold
+baked_scaffolds_dir = models_dir / "scaffolds"
+
+# Hugging Face cache entries written by download_model
+CACHED_REPOS = ("models--boltzgen--boltzgen-1", "datasets--boltzgen--inference-data")
+
 # Image for downloading model
 download_image = (
     modal.Image.debian_slim()
-    .pip_install("huggingface-hub==0.36.0", "hf_transfer")
-    .env({"HF_HUB_ENABLE_HF_TRANSFER": "1"})
+    .pip_install("huggingface-hub==0.36.0", "hf_transfer>=0.1.6")
+    .env({"HF_HUB_ENABLE_HF_TRANSFER": "1", "HF_HUB_DOWNLOAD_TIMEOUT": "60"})
+)
+
+
+AA_3TO1 = {
+    "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
+    "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
+    "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
+    "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
+}
+
+# ATOM record for one chain: residue name (cols 18-20), residue number (23-26),
+# insertion code (27, may be absent on truncated lines). The chain ID is filled
+# in per call so other chains are skipped inside the regex engine.
+ATOM_RESIDUE_PATTERN = r"\nATOM.{13}(.{3}).%s(.{4})(.?)"
+
+# Lines extract_chain_from_pdb_content cares about: ATOM/HETATM records of one
+# chain (chain ID in column 22, filled in per call), TER and END records.
+# Anchored on a literal newline (callers prepend one) for fast prefix search.
+CHAIN_RECORD_PATTERN = r"\n((?:ATOM.{17}|HETATM.{15})%s[^\n]*|TER[^\n]*|END[^\n]*)"
+
+# Design spec for build_design_spec_yaml: binder length range, target file
+# path, target chain ID. BINDING_TYPES_YAML (target chain ID, comma-separated
+# hotspot residues) is appended when hotspots are given.
+DESIGN_SPEC_YAML = (
+    "entities:\n"
+    "  - protein:\n"
+    "      id: B\n"
+    "      sequence: %s\n"
+    "  - file:\n"
+    "      path: %s\n"
+    "      include:\n"
+    "        - chain:\n"
+    "            id: %s"
+)
+BINDING_TYPES_YAML = "\n\nbinding_types:\n  - chain:\n      id: %s\n      binding: %s"
+
+# Target spec for build_fab_target_yaml: target file path, target chain ID;
+# one "        - <scaffold.yaml>" line follows per scaffold
+FAB_TARGET_YAML = (
+    "entities:\n"
+    "  - file:\n"
+    "      path: %s\n"
+    "      include:\n"
+    "        - chain:\n"
+    "            id: %s\n"
+    "  - file:\n"
+    "      path:"
 )
 
+# Non-standard residue in _entity_poly.pdbx_seq_one_letter_code, e.g. "(MSE)".
+# Boltz/BoltzGen write every residue this way: "(GLN)(THR)(PRO)..."
+PARENTHESIZED_RESIDUE_PATTERN = re.compile(r"\(([^()]*)\)")
+
+# One value in an mmCIF line: quoted string or bare token
+CIF_TOKEN_PATTERN = re.compile(r"'([^']*)'|\"([^\"]*)\"|(\S+)")
+
+# Framework-1 prefixes used to tell VH (heavy) from VL (kappa/lambda light)
+# chains in Fab designs
+VH_PREFIX_PATTERN = re.compile(r"EVQL|QVQL|DVQL|EVKL|QVKL|EVLL", re.IGNORECASE)
+VL_PREFIX_PATTERN = re.compile(r"DIQ|DIV|DTV|EIV|AIQ|SIV", re.IGNORECASE)
+
+# BoltzGen metrics CSV columns copied onto each design (as floats), by design key
+DESIGN_METRIC_COLUMNS = {
+    "ipTM": "design_to_target_iptm",
+    "pTM": "design_ptm",
+    "pae_min": "min_design_to_target_pae",
+    "rmsd": "filter_rmsd",
+    "rmsd_design": "filter_rmsd_design",
+}
+FAB_METRIC_COLUMNS = {
+    key: column for key, column in DESIGN_METRIC_COLUMNS.items() if key != "pae_min"
+}
+
 
 def extract_chain_from_pdb_content(pdb_content: str, chain_id: str) -> str:
     """Extract a single chain from PDB content.
@@ -70,23 +172,30 @@ def extract_chain_from_pdb_content(pdb_content: str, chain_id: str) -> str:
     lines = []
     atom_count = 0
 
-    for line in pdb_content.split("\n"):
-        if line.startswith("ATOM") or line.startswith("HETATM"):
-            if len(line) > 21 and line[21] == chain_id:
-                lines.append(line)
-                atom_count += 1
-        elif line.startswith("TER"):
-            if lines and len(lines[-1]) > 21 and lines[-1][21] == chain_id:
+    # The regex engine skips other chains' atoms and all other records; only
+    # candidate lines reach the Python loop
+    if len(chain_id) == 1:
+        pattern = re.compile(CHAIN_RECORD_PATTERN % re.escape(chain_id))
+        candidates = pattern.findall("\n" + pdb_content)
+    else:
+        candidates = []
+
+    for line in candidates:
+        if line.startswith("TER"):
+            if lines and lines[-1][21:22] == chain_id:
                 lines.append(line)
         elif line.startswith("END"):
             lines.append(line)
             break
+        else:
+            lines.append(line)
+            atom_count += 1
 
     if atom_count == 0:
         available_chains = set()
         for line in pdb_content.split("\n"):
-            if line.startswith("ATOM") and len(line) > 21:
-                available_chains.add(line[21])
+            if line.startswith("ATOM") and line[21:22]:
+                available_chains.add(line[21:22])
         raise ValueError(
             f"Chain '{chain_id}' not found in PDB. "
             f"Available chains: {sorted(available_chains)}"
@@ -97,33 +206,263 @@ def extract_chain_from_pdb_content(pdb_content: str, chain_id: str) -> str:
 
 def parse_pdb_sequence(pdb_content: str, chain_id: str = "A") -> str:
     """Extract amino acid sequence from PDB content."""
-    aa_3to1 = {
-        "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
-        "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
-        "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
-        "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
+    pattern = re.compile(ATOM_RESIDUE_PATTERN % re.escape(chain_id))
+    residues = {}
+
+    # dict.fromkeys drops repeated atoms of the same residue in C, keeping first-seen order
+    matches = dict.fromkeys(pattern.findall("\n" + pdb_content))
+    for res_name, res_num, insertion_code in matches:
+        aa = AA_3TO1.get(res_name)
+        if aa is None:
+            continue
+        residues.setdefault((int(res_num), insertion_code or " ", res_name), aa)
+
+    # Stable sort keeps first-seen order for residues sharing (number, insertion code)
+    return "".join(residues[key] for key in sorted(residues, key=lambda k: (k[0], k[1])))
+
+
+@functools.lru_cache(maxsize=32)
+def prepare_target_chain(pdb_content: str, chain_id: str) -> tuple[str, str]:
+    """Extract the target chain and its sequence, cached per container.
+
+    Warm containers serve many run_boltzgen/run_boltzgen_fab calls, and sweeps
+    (hotspots, protocols, seeds) often reuse the same target, so repeated
+    (content, chain) pairs skip the PDB scan.
+
+    Returns:
+        Tuple of (single-chain PDB string, one-letter sequence).
+
+    Raises:
+        ValueError: If the chain is not found (not cached).
+    """
+    extracted_pdb = extract_chain_from_pdb_content(pdb_content, chain_id)
+    return extracted_pdb, parse_pdb_sequence(extracted_pdb, chain_id)
+
+
+def find_output_files(search_dirs: list[Path]) -> dict[str, list[Path]]:
+    """Collect BoltzGen output files from each search directory in one walk.
+
+    Args:
+        search_dirs: Directories to search recursively, in priority order.
+
+    Returns:
+        Dict mapping "fasta", "cif", "json" and "csv" to file paths, grouped by
+        search directory (and within one directory, .fasta before .fa).
+    """
+    suffixes = (".fasta", ".fa", ".cif", ".json", ".csv")
+    found = {"fasta": [], "cif": [], "json": [], "csv": []}
+
+    for search_dir in search_dirs:
+        if not search_dir.is_dir():
+            continue
+        by_suffix = {suffix: [] for suffix in suffixes}
+        for root, _dirs, files in os.walk(search_dir):
+            for name in files:
+                suffix = name[name.rfind("."):]
+                if suffix in by_suffix:
+                    by_suffix[suffix].append(Path(root) / name)
+        found["fasta"].extend(by_suffix[".fasta"] + by_suffix[".fa"])
+        found["cif"].extend(by_suffix[".cif"])
+        found["json"].extend(by_suffix[".json"])
+        found["csv"].extend(by_suffix[".csv"])
+
+    return found
+
+
+def parse_fasta(content: str) -> list[tuple[str, str]]:
+    """Parse FASTA text into (header, sequence) pairs.
+
+    Splits on record boundaries rather than walking lines, so the per-line
+    work (joining wrapped sequence lines, dropping CR/blank lines) happens in C.
+    Records with an empty header or sequence are skipped.
+    """
+    records = []
+    for record in ("\n" + content).split("\n>")[1:]:
+        header, _, body = record.partition("\n")
+        header = header.rstrip()
+        sequence = "".join(body.split())
+        if header and sequence:
+            records.append((header, sequence))
+    return records
+
+
+def decode_entity_sequence(one_letter_code: str, canonical: str = "") -> str:
+    """One-letter sequence for an _entity_poly row.
+
+    The canonical column (pdbx_seq_one_letter_code_can) is used when it holds
+    real residues. Boltz writes it as all "X" and puts 3-letter codes in
+    parentheses in pdbx_seq_one_letter_code, so those are decoded through
+    AA_3TO1; unknown residues become "X".
+
+    Args:
+        one_letter_code: pdbx_seq_one_letter_code value.
+        canonical: pdbx_seq_one_letter_code_can value ("" if absent or null).
+
+    Returns:
+        Sequence with whitespace removed.
+    """
+    canonical = "".join(canonical.split())
+    if canonical.strip("X"):
+        return canonical
+    return PARENTHESIZED_RESIDUE_PATTERN.sub(
+        lambda m: AA_3TO1.get(m.group(1).upper(), "X"),
+        "".join(one_letter_code.split()),
+    )
+
+
+def read_entity_sequences(cif_content: str) -> dict[str, str]:
+    """Map entity ID to one-letter sequence from an mmCIF _entity_poly category.
+
+    Uses gemmi's C++ mmCIF reader, which handles quoted values and multi-line
+    (;-delimited) sequences. Falls back to _read_entity_sequences_by_line if
+    gemmi is not installed or cannot parse the file.
+
+    Args:
+        cif_content: mmCIF file content as string.
+
+    Returns:
+        Dict mapping entity ID to sequence (see decode_entity_sequence), in
+        file order (empty if the category has no pdbx_seq_one_letter_code column).
+    """
+    try:
+        import gemmi
+    except ImportError:
+        return _read_entity_sequences_by_line(cif_content)
+
+    try:
+        block = gemmi.cif.read_string(cif_content).sole_block()
+    except (RuntimeError, ValueError):
+        return _read_entity_sequences_by_line(cif_content)
+
+    table = block.find(
+        "_entity_poly.",
+        ["entity_id", "pdbx_seq_one_letter_code", "?pdbx_seq_one_letter_code_can"],
+    )
+    return {
+        row.str(0): decode_entity_sequence(row.str(1), row.str(2) if row.has(2) else "")
+        for row in table
     }
 
-    sequence = []
-    seen_residues = set()
 
-    for line in pdb_content.split("\n"):
-        if line.startswith("ATOM"):
-            chain = line[21]
-            if chain != chain_id:
-                continue
+def _read_entity_sequences_by_line(cif_content: str) -> dict[str, str]:
+    """Pure-Python _entity_poly reader (loop or key-value form).
+
+    Collects the category's values in order, joining ;-delimited text fields,
+    and reads each row's columns by their position in the tag list.
+    """
+    columns = []
+    values = []
+    text_field = None
+
+    for line in cif_content.split("\n"):
+        if text_field is not None:
+            if line.startswith(";"):
+                values.append("".join(text_field))
+                text_field = None
+            else:
+                text_field.append(line.strip())
+            continue
 
-            res_name = line[17:20].strip()
-            res_num = int(line[22:26])
-            insertion_code = line[26] if len(line) > 26 else " "
-            res_key = (res_num, insertion_code, res_name)
+        line = line.strip()
+        if line.startswith("_entity_poly."):
+            tag, *rest = line.split(None, 1)
+            columns.append(tag[len("_entity_poly."):])
+            line = rest[0] if rest else ""
+        elif not columns or line.startswith("loop_"):
+            continue
+        elif line.startswith(("_", "#", "data_")):
+            break
 
-            if res_key not in seen_residues and res_name in aa_3to1:
-                seen_residues.add(res_key)
-                sequence.append((res_num, insertion_code, aa_3to1[res_name]))
+        if line.startswith(";"):
+            text_field = [line[1:].strip()]
+        elif line:
+            values.extend(
+                next(group for group in m.groups() if group is not None)
+                for m in CIF_TOKEN_PATTERN.finditer(line)
+            )
 
-    sequence.sort(key=lambda x: (x[0], x[1]))
-    return "".join([aa for _, _, aa in sequence])
+    if "entity_id" not in columns or "pdbx_seq_one_letter_code" not in columns:
+        return {}
+
+    id_idx = columns.index("entity_id")
+    seq_idx = columns.index("pdbx_seq_one_letter_code")
+    can_idx = (
+        columns.index("pdbx_seq_one_letter_code_can")
+        if "pdbx_seq_one_letter_code_can" in columns
+        else None
+    )
+    sequences = {}
+    for start in range(0, len(values) - len(columns) + 1, len(columns)):
+        row = values[start:start + len(columns)]
+        canonical = row[can_idx] if can_idx is not None else ""
+        sequences[row[id_idx]] = decode_entity_sequence(
+            row[seq_idx], "" if canonical in ("?", ".") else canonical
+        )
+
+    return sequences
+
+
+def design_key(name: str) -> str:
+    """Canonical design name for matching outputs to CSV metrics rows.
+
+    FASTA headers can carry a description after the name, and CSV rows may
+    name the structure file, so both sides are reduced to the first
+    whitespace-separated token without a structure/sequence file suffix.
+    """
+    parts = name.split(maxsplit=1)
+    if not parts:
+        return ""
+    token = parts[0]
+    for suffix in (".cif", ".pdb", ".fasta", ".fa"):
+        if token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def read_design_metrics(csv_files: list[Path], verbose: bool = False) -> dict[str, dict]:
+    """Read per-design metrics from BoltzGen CSV outputs.
+
+    metrics.csv files are read first. The first row seen for a design ID wins,
+    and its row position (1-indexed) is stored as "_boltzgen_rank", since CSV
+    row order is BoltzGen's internal ranking (decision tree output).
+
+    Args:
+        csv_files: CSV files found in the output directory.
+        verbose: Print each design's rank, ipTM and pTM as it is read.
+
+    Returns:
+        Dict mapping design_key(design ID) to its CSV row (column name -> string value).
+    """
+    metrics_by_design = {}
+    # Sort to prefer metrics.csv over other CSVs
+    csv_files_sorted = sorted(csv_files, key=lambda f: "metrics" in f.name, reverse=True)
+    for csv_file in csv_files_sorted:
+        try:
+            with csv_file.open(newline="") as fh:
+                reader = csv.reader(fh)
+                # Header is the first non-blank row
+                headers = next((row for row in reader if row), None)
+                if headers is None:
+                    continue
+                print(f"  CSV {csv_file.name}: {headers[:8]}...")
+                for rank_idx, values in enumerate(reader):
+                    if len(values) < len(headers):
+                        continue
+                    row_dict = dict(zip(headers, values))
+                    # Use 'id' column as key (BoltzGen uses this)
+                    design_id = row_dict.get("id", row_dict.get("file_name", ""))
+                    key = design_key(design_id)
+                    if key and key not in metrics_by_design:
+                        row_dict["_boltzgen_rank"] = rank_idx + 1
+                        metrics_by_design[key] = row_dict
+                        if verbose:
+                            iptm = row_dict.get("design_to_target_iptm", "N/A")
+                            ptm = row_dict.get("design_ptm", "N/A")
+                            print(f"    rank {rank_idx + 1}: {design_id}: ipTM={iptm}, pTM={ptm}")
+        except Exception as e:
+            print(f"  Error parsing CSV {csv_file}: {e}")
+
+    return metrics_by_design
 
 
 def build_design_spec_yaml(
@@ -156,31 +495,107 @@ def build_design_spec_yaml(
         # Use a small range around the target length for flexibility
         length_spec = f"{binder_length - 10}..{binder_length + 10}"
 
-    # Build YAML manually (avoid PyYAML dependency)
-    lines = ["entities:"]
-
-    # Designed binder chain - use range notation
-    lines.append("  - protein:")
-    lines.append("      id: B")
-    lines.append(f"      sequence: {length_spec}")
-
-    # Target from file
-    lines.append("  - file:")
-    lines.append(f"      path: {target_cif_path}")
-    lines.append("      include:")
-    lines.append("        - chain:")
-    lines.append(f"            id: {target_chain}")
+    # Build YAML from templates (avoid PyYAML dependency): designed binder chain
+    # with range notation, then the target chain from file
+    spec = DESIGN_SPEC_YAML % (length_spec, target_cif_path, target_chain)
 
     # Add binding site specification if hotspot residues provided
     if hotspot_residues:
-        lines.append("")
-        lines.append("binding_types:")
-        lines.append("  - chain:")
-        lines.append(f"      id: {target_chain}")
-        residues_str = ",".join(str(r) for r in hotspot_residues)
-        lines.append(f"      binding: {residues_str}")
+        residues_str = ",".join(map(str, hotspot_residues))
+        spec += BINDING_TYPES_YAML % (target_chain, residues_str)
 
-    return "\n".join(lines)
+    return spec
+
+
+def run_streaming(cmd: list[str], timeout: float) -> tuple[int, str]:
+    """Run a CLI command, streaming its output to the container log.
+
+    Same as protenix_app.run_streaming (each Modal app is a standalone script).
+
+    stderr is merged into stdout and echoed line by line, so progress shows up
+    in Modal logs as it happens instead of being buffered until exit. Only the
+    last OUTPUT_TAIL_LINES lines are kept for error reporting.
+
+    Returns:
+        Tuple of (return code, tail of the combined output).
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout seconds.
+    """
+    tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+    timed_out = threading.Event()
+
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, start_new_session=True
+    ) as proc:
+        def kill():
+            # The command runs in its own session; kill the whole group so
+            # worker processes holding the pipe open go down with it
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                return  # already exited
+            timed_out.set()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                print(line, end="")
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            # A kill in progress finishes (and sets timed_out) before the check below
+            timer.join()
+
+    output = "".join(tail)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+    return returncode, output
+
+
+def boltzgen_cache_dir() -> Path:
+    """Directory to pass as BoltzGen's --cache.
+
+    The first call in a container copies the volume's Hugging Face cache to
+    LOCAL_CACHE_DIR, so model loads in this and later (warm) runs read local
+    disk. Returns models_dir instead when staging is disabled, the volume cache
+    is incomplete (artifacts BoltzGen fetches then land on the volume), or
+    local disk is too small.
+    """
+    if not LOCAL_CACHE_DIR:
+        return models_dir
+    local_cache = Path(LOCAL_CACHE_DIR)
+    if local_cache.is_dir():
+        return local_cache
+    if not all((models_dir / name).is_dir() for name in CACHED_REPOS):
+        return models_dir
+
+    # lstat: snapshot entries are symlinks into blobs/, copied as links
+    size = sum(
+        os.lstat(os.path.join(root, name)).st_size
+        for root, _dirs, files in os.walk(models_dir)
+        for name in files
+    )
+    local_cache.parent.mkdir(parents=True, exist_ok=True)
+    free = shutil.disk_usage(local_cache.parent).free
+    if free < 2 * size:
+        print(f"Only {free >> 20} MiB free for a {size >> 20} MiB model cache; using the volume")
+        return models_dir
+
+    # Copy under a temporary name so an interrupted copy is never used
+    partial = local_cache.with_name(local_cache.name + ".partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    try:
+        shutil.copytree(models_dir, partial, symlinks=True)
+    except OSError as e:
+        print(f"Could not stage model cache to {local_cache}: {e}; using the volume")
+        shutil.rmtree(partial, ignore_errors=True)
+        return models_dir
+    partial.rename(local_cache)
+    print(f"Staged {size >> 20} MiB model cache to {local_cache}")
+    return local_cache
 
 
 @app.function(
@@ -189,26 +604,42 @@ def build_design_spec_yaml(
     image=download_image,
 )
 def download_model(force_download: bool = False):
-    """Download BoltzGen model weights to Modal volume."""
+    """Download BoltzGen model weights to Modal volume.
+
+    BoltzGen resolves its artifacts with hf_hub_download(cache_dir=--cache), so
+    the volume is populated in Hugging Face cache layout; run_boltzgen passes
+    the same directory as --cache and finds the files without re-downloading.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
     from huggingface_hub import snapshot_download
 
-    # All BoltzGen checkpoints are in boltzgen/boltzgen-1
-    # See: https://huggingface.co/boltzgen/boltzgen-1
-    print("Downloading BoltzGen model weights from boltzgen/boltzgen-1...")
-    snapshot_download(
-        repo_id="boltzgen/boltzgen-1",
-        local_dir=models_dir / "boltzgen-1",
-        force_download=force_download,
-    )
+    # The two repos are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # All BoltzGen checkpoints are in boltzgen/boltzgen-1
+        # See: https://huggingface.co/boltzgen/boltzgen-1
+        print("Downloading BoltzGen model weights from boltzgen/boltzgen-1...")
+        weights = executor.submit(
+            snapshot_download,
+            repo_id="boltzgen/boltzgen-1",
+            cache_dir=models_dir,
+            force_download=force_download,
+            max_workers=16,
+        )
 
-    # Also download inference data (molecular info) - this is a dataset repo
-    print("Downloading inference data...")
-    snapshot_download(
-        repo_id="boltzgen/inference-data",
-        repo_type="dataset",
-        local_dir=models_dir / "inference-data",
-        force_download=force_download,
-    )
+        # Also download inference data (molecular info) - this is a dataset repo
+        print("Downloading inference data...")
+        inference_data = executor.submit(
+            snapshot_download,
+            repo_id="boltzgen/inference-data",
+            repo_type="dataset",
+            cache_dir=models_dir,
+            force_download=force_download,
+            max_workers=16,
+        )
+
+        weights.result()
+        inference_data.result()
 
     boltzgen_model_volume.commit()
     print(f"Models downloaded to {models_dir}")
@@ -218,7 +649,9 @@ def download_model(force_download: bool = False):
     image=boltzgen_image,
     volumes={models_dir: boltzgen_model_volume},
     timeout=60 * MINUTES,
-    gpu="A100",
+    gpu=BOLTZGEN_GPUS,
+    max_containers=16,  # fan-out limit for run_boltzgen_batch
+    scaledown_window=5 * MINUTES,  # keep the staged model cache warm between sweep calls
 )
 def run_boltzgen(
     target_pdb_content: str,
@@ -251,10 +684,8 @@ def run_boltzgen(
         ValueError: If target_chain is not found in the PDB.
     """
     # CRITICAL: Extract only the target chain to avoid design bias
-    extracted_pdb = extract_chain_from_pdb_content(target_pdb_content, target_chain)
-
-    # Get target sequence for logging
-    target_sequence = parse_pdb_sequence(extracted_pdb, target_chain)
+    # (target sequence is for logging)
+    extracted_pdb, target_sequence = prepare_target_chain(target_pdb_content, target_chain)
     print(f"Target sequence ({len(target_sequence)} aa): {target_sequence[:50]}...")
 
     # Write target PDB to file (BoltzGen needs file reference, not inline sequence)
@@ -284,22 +715,25 @@ def run_boltzgen(
         "--protocol", protocol,
         "--output", str(output_dir),
         "--num_designs", str(num_designs),
-        "--cache", str(models_dir),
+        "--cache", str(boltzgen_cache_dir()),
     ]
 
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    returncode, output_tail = run_streaming(cmd, timeout=55 * MINUTES)
 
-    print(f"STDOUT: {result.stdout}")
-    if result.returncode != 0:
-        print(f"STDERR: {result.stderr}")
+    # Persist any artifacts BoltzGen had to fetch into the --cache volume
+    # (nothing to commit when --cache is the local copy)
+    boltzgen_model_volume.commit()
+
+    if returncode != 0:
+        print(f"BoltzGen exited with code {returncode}")
         # Fallback: check if intermediate designs exist despite failure
         # (kept for robustness even though Dec 17 refolding fix should resolve this)
         ifold_dir = output_dir / "intermediate_designs_inverse_folded"
         if ifold_dir.exists():
             print(f"Pipeline failed but intermediate designs found at {ifold_dir}")
         else:
-            raise RuntimeError(f"BoltzGen failed: {result.stderr}")
+            raise RuntimeError(f"BoltzGen failed:\n{output_tail}")
 
     # Parse outputs - BoltzGen outputs FASTA and/or CIF files
     designs = []
@@ -311,76 +745,24 @@ def run_boltzgen(
         output_dir / "intermediate_designs",
     ]
 
-    fasta_files = []
-    cif_files = []
-    json_files = []
-    csv_files = []
-
-    for search_dir in search_dirs:
-        if search_dir.exists():
-            fasta_files.extend(list(search_dir.glob("**/*.fasta")))
-            fasta_files.extend(list(search_dir.glob("**/*.fa")))
-            cif_files.extend(list(search_dir.glob("**/*.cif")))
-            json_files.extend(list(search_dir.glob("**/*.json")))
-            csv_files.extend(list(search_dir.glob("**/*.csv")))
+    output_files = find_output_files(search_dirs)
+    fasta_files = output_files["fasta"]
+    cif_files = output_files["cif"]
+    json_files = output_files["json"]
+    csv_files = output_files["csv"]
 
     print(f"Found {len(fasta_files)} FASTA, {len(cif_files)} CIF, {len(json_files)} JSON, {len(csv_files)} CSV files")
 
     # Parse metrics from CSV if available (prefer metrics.csv which has design scores)
     # IMPORTANT: CSV row order = BoltzGen's internal ranking (decision tree output)
-    metrics_by_design = {}
-    # Sort to prefer metrics.csv over other CSVs
-    csv_files_sorted = sorted(csv_files, key=lambda f: "metrics" in f.name, reverse=True)
-    for csv_file in csv_files_sorted:
-        try:
-            content = csv_file.read_text()
-            csv_lines = content.strip().split("\n")
-            if len(csv_lines) < 2:
-                continue
-            headers = csv_lines[0].split(",")
-            print(f"  CSV {csv_file.name}: {headers[:8]}...")
-            for rank_idx, row in enumerate(csv_lines[1:]):
-                values = row.split(",")
-                if len(values) >= len(headers):
-                    row_dict = dict(zip(headers, values))
-                    # Use 'id' column as key (BoltzGen uses this)
-                    design_id = row_dict.get("id", row_dict.get("file_name", ""))
-                    if design_id and design_id not in metrics_by_design:
-                        # Row order in CSV = BoltzGen's rank (0-indexed)
-                        row_dict["_boltzgen_rank"] = rank_idx + 1
-                        metrics_by_design[design_id] = row_dict
-                        iptm = row_dict.get("design_to_target_iptm", "N/A")
-                        ptm = row_dict.get("design_ptm", "N/A")
-                        print(f"    rank {rank_idx + 1}: {design_id}: ipTM={iptm}, pTM={ptm}")
-        except Exception as e:
-            print(f"  Error parsing CSV {csv_file}: {e}")
+    metrics_by_design = read_design_metrics(csv_files, verbose=True)
 
     # Parse FASTA outputs for sequences
     for fasta_file in fasta_files:
-        content = fasta_file.read_text()
-        # Simple FASTA parser
-        current_header = None
-        current_seq = []
-
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith(">"):
-                if current_header and current_seq:
-                    designs.append({
-                        "sequence": "".join(current_seq),
-                        "header": current_header,
-                        "source_file": fasta_file.name,
-                    })
-                current_header = line[1:]
-                current_seq = []
-            elif line:
-                current_seq.append(line)
-
-        # Don't forget last sequence
-        if current_header and current_seq:
+        for header, sequence in parse_fasta(fasta_file.read_text()):
             designs.append({
-                "sequence": "".join(current_seq),
-                "header": current_header,
+                "sequence": sequence,
+                "header": header,
                 "source_file": fasta_file.name,
             })
 
@@ -401,41 +783,14 @@ def run_boltzgen(
                 continue
             print(f"  Processing {cif_file}...")
             try:
-                content = cif_file.read_text()
-                lines = content.split("\n")
-
-                # Parse _entity_poly loop for sequences
-                # Format: entity_id type strand_id sequence
-                # Entity 1 is the binder (chain B), Entity 2 is the target
-                in_entity_poly = False
-                entity_poly_cols = []
-                seq_col_idx = -1
-                binder_sequence = None
+                sequences = read_entity_sequences(cif_file.read_text())
 
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("_entity_poly."):
-                        in_entity_poly = True
-                        col_name = line.split(".")[1]
-                        entity_poly_cols.append(col_name)
-                        if col_name == "pdbx_seq_one_letter_code":
-                            seq_col_idx = len(entity_poly_cols) - 1
-                    elif in_entity_poly:
-                        if line.startswith("_") or line.startswith("#") or line == "":
-                            in_entity_poly = False
-                            continue
-                        if line.startswith("loop_"):
-                            continue
-                        # Data line - parse entity_id and sequence
-                        parts = line.split()
-                        if len(parts) >= 4 and seq_col_idx >= 0:
-                            entity_id = parts[0]
-                            # Sequence is typically the last column
-                            sequence = parts[-1] if len(parts) > seq_col_idx else parts[seq_col_idx]
-                            print(f"    Entity {entity_id}: {sequence[:50]}... ({len(sequence)} aa)")
-                            # Entity 1 is the binder (first in YAML = chain B)
-                            if entity_id == "1" and "X" not in sequence:
-                                binder_sequence = sequence
+                # Entity 1 is the binder (first in YAML = chain B), entity 2 the target
+                binder_sequence = None
+                for entity_id, sequence in sequences.items():
+                    print(f"    Entity {entity_id}: {sequence[:50]}... ({len(sequence)} aa)")
+                    if entity_id == "1" and "X" not in sequence:
+                        binder_sequence = sequence
 
                 if binder_sequence:
                     designs.append({
@@ -469,16 +824,11 @@ def run_boltzgen(
     for i, design in enumerate(designs):
         design["design_idx"] = i
         # Try to match with CSV metrics by design name
-        design_name = design.get("header", "")
-        if design_name in metrics_by_design:
-            metrics = metrics_by_design[design_name]
-            # BoltzGen uses these column names
+        metrics = metrics_by_design.get(design_key(design.get("header", "")))
+        if metrics is not None:
             try:
-                design["ipTM"] = float(metrics.get("design_to_target_iptm", 0))
-                design["pTM"] = float(metrics.get("design_ptm", 0))
-                design["pae_min"] = float(metrics.get("min_design_to_target_pae", 0))
-                design["rmsd"] = float(metrics.get("filter_rmsd", 0))
-                design["rmsd_design"] = float(metrics.get("filter_rmsd_design", 0))
+                for key, column in DESIGN_METRIC_COLUMNS.items():
+                    design[key] = float(metrics.get(column, 0))
                 design["boltzgen_rank"] = metrics.get("_boltzgen_rank", i + 1)
             except (ValueError, TypeError):
                 pass  # Skip if conversion fails
@@ -510,6 +860,14 @@ AVAILABLE_FAB_SCAFFOLDS = [
 ]
 
 
+def scaffold_cif_filename(name: str, yaml_content: str) -> str:
+    """CIF filename a scaffold YAML refers to (first 'path:' line naming a .cif)."""
+    for line in yaml_content.split("\n"):
+        if line.strip().startswith("path:") and ".cif" in line:
+            return line.split(":")[-1].strip()
+    return f"{name}.cif"
+
+
 def build_fab_target_yaml(
     target_cif_path: str,
     target_chain: str,
@@ -529,29 +887,17 @@ def build_fab_target_yaml(
     Returns:
         YAML string for BoltzGen target spec.
     """
-    lines = ["entities:"]
-
-    # Target from file
-    lines.append("  - file:")
-    lines.append(f"      path: {target_cif_path}")
-    lines.append("      include:")
-    lines.append("        - chain:")
-    lines.append(f"            id: {target_chain}")
-
-    # Scaffold files (each defines a Fab)
-    lines.append("  - file:")
-    lines.append("      path:")
-    for scaffold_path in scaffold_yaml_paths:
-        lines.append(f"        - {scaffold_path}")
-
-    return "\n".join(lines)
+    # Target from file, then the scaffold files (each defines a Fab)
+    scaffold_paths = "".join(f"\n        - {path}" for path in scaffold_yaml_paths)
+    return FAB_TARGET_YAML % (target_cif_path, target_chain) + scaffold_paths
 
 
 @app.function(
     image=boltzgen_image,
     volumes={models_dir: boltzgen_model_volume},
     timeout=90 * MINUTES,
-    gpu="A100",
+    gpu=BOLTZGEN_GPUS,
+    scaledown_window=5 * MINUTES,
 )
 def run_boltzgen_fab(
     target_pdb_content: str,
@@ -572,6 +918,8 @@ def run_boltzgen_fab(
         target_chain: Chain ID of target in PDB (will be extracted).
         scaffold_names: Names of scaffolds to use (e.g., ["adalimumab"]).
         scaffold_yaml_contents: Dict mapping scaffold names to YAML content.
+            Scaffolds missing from both dicts use the copy written by
+            bake_scaffolds, if there is one.
         scaffold_cif_contents: Dict mapping scaffold names to CIF content.
         num_designs: Number of designs to generate per scaffold.
         seed: Random seed for reproducibility.
@@ -583,10 +931,8 @@ def run_boltzgen_fab(
         ValueError: If target_chain is not found or scaffolds are missing.
     """
     # CRITICAL: Extract only the target chain to avoid design bias
-    extracted_pdb = extract_chain_from_pdb_content(target_pdb_content, target_chain)
-
-    # Get target sequence for logging
-    target_sequence = parse_pdb_sequence(extracted_pdb, target_chain)
+    # (target sequence is for logging)
+    extracted_pdb, target_sequence = prepare_target_chain(target_pdb_content, target_chain)
     print(f"Target sequence ({len(target_sequence)} aa): {target_sequence[:50]}...")
 
     # Write target PDB to file
@@ -603,25 +949,23 @@ def run_boltzgen_fab(
 
     scaffold_yaml_paths = []
     for name in scaffold_names:
-        if scaffold_yaml_contents and name in scaffold_yaml_contents:
-            yaml_content = scaffold_yaml_contents[name]
-        else:
-            raise ValueError(f"Missing YAML content for scaffold: {name}")
+        yaml_content = (scaffold_yaml_contents or {}).get(name)
+        cif_content = (scaffold_cif_contents or {}).get(name)
+
+        # Without uploaded contents, use the copy baked into the volume (if any)
+        baked_yaml_path = baked_scaffolds_dir / name / f"{name}.yaml"
+        if yaml_content is None and cif_content is None and baked_yaml_path.exists():
+            scaffold_yaml_paths.append(str(baked_yaml_path))
+            print(f"Using baked scaffold YAML: {baked_yaml_path}")
+            continue
 
-        if scaffold_cif_contents and name in scaffold_cif_contents:
-            cif_content = scaffold_cif_contents[name]
-        else:
+        if yaml_content is None:
+            raise ValueError(f"Missing YAML content for scaffold: {name}")
+        if cif_content is None:
             raise ValueError(f"Missing CIF content for scaffold: {name}")
 
         # Find CIF filename from YAML (first line with 'path:')
-        cif_filename = None
-        for line in yaml_content.split("\n"):
-            if line.strip().startswith("path:") and ".cif" in line:
-                cif_filename = line.split(":")[-1].strip()
-                break
-
-        if not cif_filename:
-            cif_filename = f"{name}.cif"
+        cif_filename = scaffold_cif_filename(name, yaml_content)
 
         # Write CIF file
         cif_path = scaffold_dir / cif_filename
@@ -657,22 +1001,25 @@ def run_boltzgen_fab(
         "--protocol", "antibody-anything",
         "--output", str(output_dir),
         "--num_designs", str(num_designs),
-        "--cache", str(models_dir),
+        "--cache", str(boltzgen_cache_dir()),
     ]
 
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    returncode, output_tail = run_streaming(cmd, timeout=85 * MINUTES)
+
+    # Persist any artifacts BoltzGen had to fetch into the --cache volume
+    # (nothing to commit when --cache is the local copy)
+    boltzgen_model_volume.commit()
 
-    print(f"STDOUT: {result.stdout}")
-    if result.returncode != 0:
-        print(f"STDERR: {result.stderr}")
+    if returncode != 0:
+        print(f"BoltzGen exited with code {returncode}")
         # Fallback: check if intermediate designs exist despite failure
         # (kept for robustness even though Dec 17 refolding fix should resolve this)
         ifold_dir = output_dir / "intermediate_designs_inverse_folded"
         if ifold_dir.exists():
             print(f"Pipeline failed but intermediate designs found at {ifold_dir}")
         else:
-            raise RuntimeError(f"BoltzGen Fab failed: {result.stderr}")
+            raise RuntimeError(f"BoltzGen Fab failed:\n{output_tail}")
 
     # Parse outputs - look for Fab designs with VH/VL chains
     designs = []
@@ -684,41 +1031,16 @@ def run_boltzgen_fab(
         output_dir / "intermediate_designs",
     ]
 
-    fasta_files = []
-    cif_files = []
-    csv_files = []
-
-    for search_dir in search_dirs:
-        if search_dir.exists():
-            fasta_files.extend(list(search_dir.glob("**/*.fasta")))
-            fasta_files.extend(list(search_dir.glob("**/*.fa")))
-            cif_files.extend(list(search_dir.glob("**/*.cif")))
-            csv_files.extend(list(search_dir.glob("**/*.csv")))
+    output_files = find_output_files(search_dirs)
+    fasta_files = output_files["fasta"]
+    cif_files = output_files["cif"]
+    csv_files = output_files["csv"]
 
     print(f"Found {len(fasta_files)} FASTA, {len(cif_files)} CIF, {len(csv_files)} CSV files")
 
     # Parse metrics from CSV
     # IMPORTANT: CSV row order = BoltzGen's internal ranking (decision tree output)
-    metrics_by_design = {}
-    csv_files_sorted = sorted(csv_files, key=lambda f: "metrics" in f.name, reverse=True)
-    for csv_file in csv_files_sorted:
-        try:
-            content = csv_file.read_text()
-            csv_lines = content.strip().split("\n")
-            if len(csv_lines) < 2:
-                continue
-            headers = csv_lines[0].split(",")
-            print(f"  CSV {csv_file.name}: {headers[:8]}...")
-            for rank_idx, row in enumerate(csv_lines[1:]):
-                values = row.split(",")
-                if len(values) >= len(headers):
-                    row_dict = dict(zip(headers, values))
-                    design_id = row_dict.get("id", row_dict.get("file_name", ""))
-                    if design_id and design_id not in metrics_by_design:
-                        row_dict["_boltzgen_rank"] = rank_idx + 1
-                        metrics_by_design[design_id] = row_dict
-        except Exception as e:
-            print(f"  Error parsing CSV {csv_file}: {e}")
+    metrics_by_design = read_design_metrics(csv_files)
 
     # Parse CIF files to extract VH/VL sequences
     # For Fab designs, we expect two chains: VH and VL
@@ -737,35 +1059,12 @@ def run_boltzgen_fab(
 
         print(f"  Processing {cif_file}...")
         try:
-            content = cif_file.read_text()
-            lines = content.split("\n")
-
-            # Parse _entity_poly for sequences
             # For Fab: Entity 1 = VH, Entity 2 = VL, Entity 3 = target
-            in_entity_poly = False
-            entity_poly_cols = []
             sequences_by_entity = {}
-
-            for line in lines:
-                line_stripped = line.strip()
-                if line_stripped.startswith("_entity_poly."):
-                    in_entity_poly = True
-                    col_name = line_stripped.split(".")[1]
-                    entity_poly_cols.append(col_name)
-                elif in_entity_poly:
-                    if line_stripped.startswith("_") or line_stripped.startswith("#") or line_stripped == "":
-                        in_entity_poly = False
-                        continue
-                    if line_stripped.startswith("loop_"):
-                        continue
-                    parts = line_stripped.split()
-                    if len(parts) >= 2:
-                        entity_id = parts[0]
-                        # Sequence is typically the last column
-                        sequence = parts[-1] if len(parts) > 3 else ""
-                        if sequence and "X" not in sequence:
-                            sequences_by_entity[entity_id] = sequence
-                            print(f"    Entity {entity_id}: {sequence[:40]}... ({len(sequence)} aa)")
+            for entity_id, sequence in read_entity_sequences(cif_file.read_text()).items():
+                if sequence and "X" not in sequence:
+                    sequences_by_entity[entity_id] = sequence
+                    print(f"    Entity {entity_id}: {sequence[:40]}... ({len(sequence)} aa)")
 
             # Identify VH and VL by sequence characteristics
             # VH: starts with EVQL/QVQL/DVQL (heavy chain), length 115-140
@@ -774,20 +1073,16 @@ def run_boltzgen_fab(
             vh_sequence = ""
             vl_sequence = ""
 
-            vh_patterns = ("EVQL", "QVQL", "DVQL", "EVKL", "QVKL", "EVLL")
-            vl_patterns = ("DIQ", "DIV", "DTV", "EIV", "AIQ", "SIV", "DIQM", "DIQLT", "EIVL", "EIVMT")
-
             for entity_id, seq in sequences_by_entity.items():
                 seq_len = len(seq)
-                seq_prefix = seq[:5].upper()
 
                 # Check VH patterns first (heavy chain variable region)
-                if 115 <= seq_len <= 145 and any(seq.upper().startswith(p) for p in vh_patterns):
+                if 115 <= seq_len <= 145 and VH_PREFIX_PATTERN.match(seq):
                     if not vh_sequence or seq_len > len(vh_sequence):
                         vh_sequence = seq
                         print(f"    -> Entity {entity_id} identified as VH ({seq_len} aa)")
                 # Check VL patterns (light chain variable region)
-                elif 95 <= seq_len <= 125 and any(seq.upper().startswith(p) for p in vl_patterns):
+                elif 95 <= seq_len <= 125 and VL_PREFIX_PATTERN.match(seq):
                     if not vl_sequence or seq_len > len(vl_sequence):
                         vl_sequence = seq
                         print(f"    -> Entity {entity_id} identified as VL ({seq_len} aa)")
@@ -826,14 +1121,11 @@ def run_boltzgen_fab(
     # Add metrics to designs
     for i, design in enumerate(designs):
         design["design_idx"] = i
-        design_name = design.get("header", "")
-        if design_name in metrics_by_design:
-            metrics = metrics_by_design[design_name]
+        metrics = metrics_by_design.get(design_key(design.get("header", "")))
+        if metrics is not None:
             try:
-                design["ipTM"] = float(metrics.get("design_to_target_iptm", 0))
-                design["pTM"] = float(metrics.get("design_ptm", 0))
-                design["rmsd"] = float(metrics.get("filter_rmsd", 0))
-                design["rmsd_design"] = float(metrics.get("filter_rmsd_design", 0))
+                for key, column in FAB_METRIC_COLUMNS.items():
+                    design[key] = float(metrics.get(column, 0))
                 design["boltzgen_rank"] = metrics.get("_boltzgen_rank", i + 1)
             except (ValueError, TypeError):
                 pass
@@ -849,10 +1141,47 @@ def run_boltzgen_fab(
 
 
 @app.function(
-    image=boltzgen_image,
+    image=download_image,
     volumes={models_dir: boltzgen_model_volume},
+    timeout=10 * MINUTES,
+)
+def bake_scaffolds(
+    scaffold_yaml_contents: dict[str, str],
+    scaffold_cif_contents: dict[str, str],
+) -> list[str]:
+    """Store Fab scaffold YAML+CIF pairs on the model volume.
+
+    run_boltzgen_fab reads these when a caller omits a scaffold's contents,
+    so the (~1 MB per scaffold) files need not be uploaded with every call.
+
+    Args:
+        scaffold_yaml_contents: Dict mapping scaffold names to YAML content.
+        scaffold_cif_contents: Dict mapping scaffold names to CIF content.
+
+    Returns:
+        Names of the scaffolds written.
+    """
+    baked = []
+    for name, yaml_content in scaffold_yaml_contents.items():
+        if name not in scaffold_cif_contents:
+            raise ValueError(f"Missing CIF content for scaffold: {name}")
+        # YAML and CIF share a directory, so the YAML's relative CIF path holds
+        scaffold_dir = baked_scaffolds_dir / name
+        scaffold_dir.mkdir(parents=True, exist_ok=True)
+        (scaffold_dir / scaffold_cif_filename(name, yaml_content)).write_text(
+            scaffold_cif_contents[name]
+        )
+        (scaffold_dir / f"{name}.yaml").write_text(yaml_content)
+        baked.append(name)
+
+    boltzgen_model_volume.commit()
+    print(f"Baked {len(baked)} scaffolds into {baked_scaffolds_dir}")
+    return baked
+
+
+@app.function(
+    image=boltzgen_image,
     timeout=120 * MINUTES,
-    gpu="A100",
 )
 def run_boltzgen_batch(
     target_pdbs: list[dict],  # [{"name": "1XIW", "content": "...", "chain": "A"}]
@@ -863,6 +1192,9 @@ def run_boltzgen_batch(
 ) -> dict[str, list[dict]]:
     """Run BoltzGen on multiple targets.
 
+    Each target is an independent run_boltzgen call, fanned out across GPU
+    containers with .starmap() instead of running one after another.
+
     Args:
         target_pdbs: List of dicts with "name", "content", and optional "chain" keys.
         num_designs_per_target: Designs per target.
@@ -873,28 +1205,31 @@ def run_boltzgen_batch(
     Returns:
         Dictionary mapping target names to design lists.
     """
-    results = {}
+    print(f"Designing against {len(target_pdbs)} targets in parallel...")
+    outputs = run_boltzgen.starmap(
+        [
+            (
+                target["content"],
+                target.get("chain", "A"),
+                num_designs_per_target,
+                binder_length,
+                None,
+                protocol,
+                seed + i * 1000,
+            )
+            for i, target in enumerate(target_pdbs)
+        ],
+        return_exceptions=True,
+    )
 
-    for i, target in enumerate(target_pdbs):
+    results = {}
+    for target, designs in zip(target_pdbs, outputs):
         target_name = target["name"]
-        target_content = target["content"]
-        target_chain = target.get("chain", "A")
-
-        print(f"\nProcessing target {i+1}/{len(target_pdbs)}: {target_name}")
-
-        try:
-            designs = run_boltzgen(
-                target_pdb_content=target_content,
-                target_chain=target_chain,
-                num_designs=num_designs_per_target,
-                binder_length=binder_length,
-                protocol=protocol,
-                seed=seed + i * 1000,
-            )
+        if isinstance(designs, Exception):
+            print(f"Error designing for {target_name}: {designs}")
+            results[target_name] = [{"error": str(designs)}]
+        else:
             results[target_name] = designs
-        except Exception as e:
-            print(f"Error designing for {target_name}: {e}")
-            results[target_name] = [{"error": str(e)}]
 
     return results
 
@@ -911,6 +1246,7 @@ def main(
     scaffolds: str = "adalimumab",
     seed: int = 42,
     download: bool = False,
+    bake: bool = False,
 ):
     """Local entrypoint for testing.
 
@@ -925,6 +1261,7 @@ def main(
         scaffolds: Comma-separated list of scaffold names for Fab design.
         seed: Random seed.
         download: If True, download model weights and exit.
+        bake: If True, store the scaffolds in scaffold_dir on the model volume and exit.
     """
     if download:
         print("Downloading BoltzGen model weights...")
@@ -932,9 +1269,26 @@ def main(
         print("Done!")
         return
 
+    if bake:
+        scaffold_yaml_contents = {}
+        scaffold_cif_contents = {}
+        scaffold_path = Path(scaffold_dir)
+        for name in AVAILABLE_FAB_SCAFFOLDS:
+            yaml_files = list(scaffold_path.glob(f"{name}*.yaml"))
+            cif_files = list(scaffold_path.glob(f"{name}*.cif"))
+            if not yaml_files or not cif_files:
+                print(f"  Skipping scaffold '{name}': files not found in {scaffold_dir}")
+                continue
+            scaffold_yaml_contents[name] = yaml_files[0].read_text()
+            scaffold_cif_contents[name] = cif_files[0].read_text()
+        baked = bake_scaffolds.remote(scaffold_yaml_contents, scaffold_cif_contents)
+        print(f"Baked scaffolds: {', '.join(baked)}")
+        return
+
     if target_pdb is None:
         print("Usage: modal run modal/boltzgen_app.py --target-pdb <path> [--target-chain A]")
         print("   or: modal run modal/boltzgen_app.py --download")
+        print("   or: modal run modal/boltzgen_app.py --bake")
         print("\nOptions:")
         print("  --num-designs N      Number of designs to generate (default: 10)")
         print("  --design-type TYPE   Design type: vhh or fab (default: vhh)")
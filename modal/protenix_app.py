@@ -13,16 +13,22 @@ Warm up (pre-download weights):
 
 from __future__ import annotations
 
+import collections
 import json
 import os
+import signal
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 
 import modal
 
 MINUTES = 60
 
+# Lines of CLI output kept in memory for error messages (the rest is only logged)
+OUTPUT_TAIL_LINES = 200
+
 app = modal.App("protenix-cd3")
 
 # Protenix auto-downloads model weights on first prediction.
@@ -43,6 +49,52 @@ protenix_image = (
 )
 
 
+def run_streaming(cmd: list[str], timeout: float) -> tuple[int, str]:
+    """Run a CLI command, streaming its output to the container log.
+
+    stderr is merged into stdout and echoed line by line, so progress shows up
+    in Modal logs as it happens instead of being buffered until exit. Only the
+    last OUTPUT_TAIL_LINES lines are kept for error reporting.
+
+    Returns:
+        Tuple of (return code, tail of the combined output).
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout seconds.
+    """
+    tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+    timed_out = threading.Event()
+
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, start_new_session=True
+    ) as proc:
+        def kill():
+            # The command runs in its own session; kill the whole group so
+            # worker processes holding the pipe open go down with it
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                return  # already exited
+            timed_out.set()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                print(line, end="")
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            # A kill in progress finishes (and sets timed_out) before the check below
+            timer.join()
+
+    output = "".join(tail)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+    return returncode, output
+
+
 @app.function(
     image=protenix_image,
     gpu="H100",
@@ -121,20 +173,13 @@ def predict_complex(
             cmd.extend(["--use_msa", "true"])
 
         print(f"Running Protenix: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=25 * 60)
-
-        # Log stdout/stderr for debugging
-        if result.stdout:
-            print(f"Protenix stdout (last 2000 chars): {result.stdout[-2000:]}")
-        if result.stderr:
-            print(f"Protenix stderr (last 2000 chars): {result.stderr[-2000:]}")
+        returncode, output = run_streaming(cmd, timeout=25 * 60)
 
         # Commit volume to persist any newly-downloaded weights
         protenix_cache_volume.commit()
 
-        if result.returncode != 0:
-            error_msg = result.stderr[-1000:] if result.stderr else "unknown error"
-            print(f"Protenix stderr: {error_msg}")
+        if returncode != 0:
+            error_msg = output[-1000:] if output else "unknown error"
             return {
                 "error": f"Protenix failed: {error_msg[-500:]}",
                 "iptm": None,
@@ -331,14 +376,14 @@ def warmup():
         ]
 
         print("Running warmup prediction to cache model weights...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=25 * 60)
+        returncode, output = run_streaming(cmd, timeout=25 * 60)
 
         protenix_cache_volume.commit()
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("Warmup complete! Model weights cached.")
         else:
-            print(f"Warmup prediction failed (weights may still be cached): {result.stderr[-500:]}")
+            print(f"Warmup prediction failed (weights may still be cached): {output[-500:]}")
 
 
 @app.local_entrypoint()
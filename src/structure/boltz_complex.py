@@ -14,6 +14,8 @@ from typing import Optional
 import json
 import tempfile
 
+import numpy as np
+
 
 @dataclass
 class ComplexPredictionResult:
@@ -440,18 +442,21 @@ def run_calibration(
     if not results:
         raise RuntimeError("Calibration failed - no successful predictions")
 
-    # Calculate thresholds (minimum of known binders minus margin)
-    pdockq_values = [r.pdockq for r in results]
-    area_values = [r.interface_area for r in results]
-    contact_values = [r.num_contacts for r in results]
+    # Calculate thresholds (minimum of known binders minus margin): one (N, 3)
+    # array of pdockq, interface_area, num_contacts reduced column-wise
+    stats = np.array(
+        [[r.pdockq, r.interface_area, r.num_contacts] for r in results],
+        dtype=np.float64,
+    )
+    mins, maxs, means = stats.min(axis=0), stats.max(axis=0), stats.mean(axis=0)
 
     calibration = {
         "known_binder_results": [r.to_dict() for r in results],
         "cif_strings": cif_strings,
         "calibrated_thresholds": {
-            "min_pdockq": max(0.0, min(pdockq_values) - pdockq_margin),
-            "min_interface_area": max(0.0, min(area_values) - interface_area_margin),
-            "min_contacts": max(0, min(contact_values) - contacts_margin),
+            "min_pdockq": max(0.0, float(mins[0]) - pdockq_margin),
+            "min_interface_area": max(0.0, float(mins[1]) - interface_area_margin),
+            "min_contacts": max(0, int(mins[2]) - contacts_margin),
         },
         "margins_used": {
             "pdockq_margin": pdockq_margin,
@@ -459,9 +464,9 @@ def run_calibration(
             "contacts_margin": contacts_margin,
         },
         "known_binder_stats": {
-            "pdockq": {"min": min(pdockq_values), "max": max(pdockq_values), "mean": sum(pdockq_values) / len(pdockq_values)},
-            "interface_area": {"min": min(area_values), "max": max(area_values), "mean": sum(area_values) / len(area_values)},
-            "contacts": {"min": min(contact_values), "max": max(contact_values), "mean": sum(contact_values) / len(contact_values)},
+            "pdockq": {"min": float(mins[0]), "max": float(maxs[0]), "mean": float(means[0])},
+            "interface_area": {"min": float(mins[1]), "max": float(maxs[1]), "mean": float(means[1])},
+            "contacts": {"min": int(mins[2]), "max": int(maxs[2]), "mean": float(means[2])},
         },
     }
 
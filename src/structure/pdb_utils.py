@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Optional
 import re
 
+import numpy as np
+
 
 # Standard amino acid 3-letter to 1-letter mapping
 AA_3TO1 = {
@@ -13,6 +15,10 @@ AA_3TO1 = {
     "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
 }
 
+# Squared distances per block in the contact search (256 KiB of float32,
+# small enough to stay in L2 while the block is filled and scanned)
+CONTACT_CHUNK_ELEMENTS = 1 << 16
+
 
 def extract_sequence_from_pdb(
     pdb_path: str,
@@ -41,9 +47,10 @@ def extract_sequence_from_pdb(
                 res_num = int(line[22:26])
                 res_key = (res_num, res_name)
 
-                if res_key not in seen_residues and res_name in AA_3TO1:
+                aa = AA_3TO1.get(res_name)
+                if aa is not None and res_key not in seen_residues:
                     seen_residues.add(res_key)
-                    sequence.append((res_num, AA_3TO1[res_name]))
+                    sequence.append((res_num, aa))
 
     # Sort by residue number and extract sequence
     sequence.sort(key=lambda x: x[0])
@@ -77,9 +84,10 @@ def extract_sequence_with_numbering(
             res_num = int(line[22:26])
             res_key = (res_num, res_name)
 
-            if res_key not in seen_residues and res_name in AA_3TO1:
+            aa = AA_3TO1.get(res_name)
+            if aa is not None and res_key not in seen_residues:
                 seen_residues.add(res_key)
-                residues.append((res_num, AA_3TO1[res_name]))
+                residues.append((res_num, aa))
 
     # Sort by residue number
     residues.sort(key=lambda x: x[0])
@@ -171,6 +179,66 @@ def get_residue_positions(
     return sorted(positions)
 
 
+def _parse_atom_arrays(pdb_string: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse ATOM records into (chain IDs, residue numbers, N x 3 float32 coordinates).
+
+    PDB coordinates carry three decimals, well within float32 precision.
+    """
+    chains = []
+    res_nums = []
+    coords = []
+
+    for line in pdb_string.split("\n"):
+        if not line.startswith("ATOM"):
+            continue
+
+        chains.append(line[21])
+        res_nums.append(int(line[22:26]))
+        coords.append((float(line[30:38]), float(line[38:46]), float(line[46:54])))
+
+    return (
+        np.array(chains, dtype="U1"),
+        np.array(res_nums, dtype=np.int64),
+        np.array(coords, dtype=np.float32).reshape(-1, 3),
+    )
+
+
+def _find_atom_contacts(
+    xyz_a: np.ndarray,
+    xyz_b: np.ndarray,
+    distance_cutoff: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find atom index pairs (i into xyz_a, j into xyz_b) within the cutoff.
+
+    Distances are computed in blocks of rows of xyz_a holding at most
+    CONTACT_CHUNK_ELEMENTS squared distances, accumulated one axis at a time
+    so no (rows, M, 3) difference tensor is built.
+    """
+    if len(xyz_a) == 0 or len(xyz_b) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    # Keep the comparison in float32 rather than upcasting every block
+    cutoff_sq = np.float32(distance_cutoff) ** 2
+    xyz_b_t = xyz_b.T.copy()
+    rows = max(1, CONTACT_CHUNK_ELEMENTS // len(xyz_b))
+    idx_a = []
+    idx_b = []
+    for start in range(0, len(xyz_a), rows):
+        block = xyz_a[start:start + rows]
+        dist_sq = block[:, 0:1] - xyz_b_t[0]
+        dist_sq *= dist_sq
+        for axis in (1, 2):
+            diff = block[:, axis:axis + 1] - xyz_b_t[axis]
+            diff *= diff
+            dist_sq += diff
+        i, j = np.nonzero(dist_sq <= cutoff_sq)
+        idx_a.append(i + start)
+        idx_b.append(j)
+
+    return np.concatenate(idx_a), np.concatenate(idx_b)
+
+
 def calculate_interface_residues(
     pdb_string: str,
     chain_a: str,
@@ -189,38 +257,16 @@ def calculate_interface_residues(
         Tuple of (chain_a_residues, chain_b_residues) at interface.
     """
     # Parse atom coordinates
-    atoms_a = []
-    atoms_b = []
-
-    for line in pdb_string.split("\n"):
-        if not line.startswith("ATOM"):
-            continue
-
-        chain = line[21]
-        x = float(line[30:38])
-        y = float(line[38:46])
-        z = float(line[46:54])
-        res_num = int(line[22:26])
-
-        if chain == chain_a:
-            atoms_a.append((res_num, x, y, z))
-        elif chain == chain_b:
-            atoms_b.append((res_num, x, y, z))
+    chains, res_nums, xyz = _parse_atom_arrays(pdb_string)
+    mask_a = chains == chain_a
+    mask_b = (chains == chain_b) & ~mask_a
 
     # Find interface residues
-    interface_a = set()
-    interface_b = set()
-
-    cutoff_sq = distance_cutoff ** 2
+    i, j = _find_atom_contacts(xyz[mask_a], xyz[mask_b], distance_cutoff)
+    interface_a = np.unique(res_nums[mask_a][i])
+    interface_b = np.unique(res_nums[mask_b][j])
 
-    for res_a, xa, ya, za in atoms_a:
-        for res_b, xb, yb, zb in atoms_b:
-            dist_sq = (xa - xb) ** 2 + (ya - yb) ** 2 + (za - zb) ** 2
-            if dist_sq <= cutoff_sq:
-                interface_a.add(res_a)
-                interface_b.add(res_b)
-
-    return sorted(interface_a), sorted(interface_b)
+    return interface_a.tolist(), interface_b.tolist()
 
 
 def count_contacts(
@@ -245,35 +291,15 @@ def count_contacts(
         Number of residue-residue contacts.
     """
     # Parse atom coordinates with residue info
-    atoms_a = []  # (res_num, x, y, z)
-    atoms_b = []
-
-    for line in pdb_string.split("\n"):
-        if not line.startswith("ATOM"):
-            continue
-
-        chain = line[21]
-        res_num = int(line[22:26])
-        x = float(line[30:38])
-        y = float(line[38:46])
-        z = float(line[46:54])
-
-        if chain == chain_a:
-            atoms_a.append((res_num, x, y, z))
-        elif chain == chain_b:
-            atoms_b.append((res_num, x, y, z))
+    chains, res_nums, xyz = _parse_atom_arrays(pdb_string)
+    mask_a = chains == chain_a
+    mask_b = (chains == chain_b) & ~mask_a
 
     # Count unique residue pairs in contact
-    contact_pairs = set()
-    cutoff_sq = distance_cutoff ** 2
+    i, j = _find_atom_contacts(xyz[mask_a], xyz[mask_b], distance_cutoff)
+    contact_pairs = np.stack([res_nums[mask_a][i], res_nums[mask_b][j]], axis=1)
 
-    for res_a, xa, ya, za in atoms_a:
-        for res_b, xb, yb, zb in atoms_b:
-            dist_sq = (xa - xb) ** 2 + (ya - yb) ** 2 + (za - zb) ** 2
-            if dist_sq <= cutoff_sq:
-                contact_pairs.add((res_a, res_b))
-
-    return len(contact_pairs)
+    return len(np.unique(contact_pairs, axis=0))
 
 
 def estimate_interface_area(
@@ -400,39 +426,14 @@ def extract_epitope_from_complex(
         Sorted list of target residue numbers that form the epitope.
     """
     # Parse atom coordinates
-    target_atoms = []  # (res_num, x, y, z)
-    binder_atoms = []  # (x, y, z)
-
-    for line in pdb_string.split("\n"):
-        if not line.startswith("ATOM"):
-            continue
-
-        chain = line[21]
-        x = float(line[30:38])
-        y = float(line[38:46])
-        z = float(line[46:54])
-        res_num = int(line[22:26])
-
-        if chain == target_chain:
-            target_atoms.append((res_num, x, y, z))
-        elif chain in binder_chains:
-            binder_atoms.append((x, y, z))
-
-    if not target_atoms or not binder_atoms:
-        return []
+    chains, res_nums, xyz = _parse_atom_arrays(pdb_string)
+    target_mask = chains == target_chain
+    binder_mask = np.isin(chains, list(binder_chains)) & ~target_mask
 
     # Find target residues in contact with binder
-    epitope_residues = set()
-    cutoff_sq = distance_cutoff ** 2
-
-    for res_num, xt, yt, zt in target_atoms:
-        for xb, yb, zb in binder_atoms:
-            dist_sq = (xt - xb) ** 2 + (yt - yb) ** 2 + (zt - zb) ** 2
-            if dist_sq <= cutoff_sq:
-                epitope_residues.add(res_num)
-                break  # Found a contact, no need to check more binder atoms
+    i, _ = _find_atom_contacts(xyz[target_mask], xyz[binder_mask], distance_cutoff)
 
-    return sorted(epitope_residues)
+    return np.unique(res_nums[target_mask][i]).tolist()
 
 
 def download_pdb(pdb_id: str, output_path: Optional[str] = None) -> str:
@@ -0,0 +1,35 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_modal_app(name):
+    # modal/ is a directory of Modal scripts, not a package (importing "modal"
+    # resolves to the Modal SDK), so load each app by file path
+    pytest.importorskip("modal")
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / "modal" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    # Registered so numba can resolve the module when loading cached kernels
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def boltz2_app():
+    pytest.importorskip("numpy")
+    return _load_modal_app("boltz2_app")
+
+
+@pytest.fixture(scope="session")
+def boltzgen_app():
+    return _load_modal_app("boltzgen_app")
+
+
+@pytest.fixture(scope="session")
+def protenix_app():
+    return _load_modal_app("protenix_app")
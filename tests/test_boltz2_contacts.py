@@ -0,0 +1,171 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+BACKENDS = ["numba", "kdtree", "numpy"]
+
+
+@pytest.fixture(params=BACKENDS)
+def contact_backend(request, boltz2_app, monkeypatch):
+    if request.param == "numba":
+        if boltz2_app.njit is None:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(boltz2_app, "HAVE_SCIPY", False)
+    elif request.param == "kdtree":
+        if not boltz2_app.HAVE_SCIPY:
+            pytest.skip("scipy not installed")
+        monkeypatch.setattr(boltz2_app, "NUMBA_CONTACT_MAX_ATOMS", 0)
+    else:
+        monkeypatch.setattr(boltz2_app, "njit", None)
+        monkeypatch.setattr(boltz2_app, "HAVE_SCIPY", False)
+    return boltz2_app
+
+
+def _brute_force_pairs(binder_xyz, target_xyz, cutoff):
+    return {
+        (i, j)
+        for i, a in enumerate(binder_xyz.tolist())
+        for j, b in enumerate(target_xyz.tolist())
+        if sum((p - q) ** 2 for p, q in zip(a, b)) <= cutoff**2
+    }
+
+
+def _grid_coords(rng, n):
+    # Half-Å grid keeps every squared distance exact in float32, so pairs at
+    # exactly the cutoff compare the same way in every backend
+    return (rng.integers(0, 40, size=(n, 3)) / 2).astype(np.float32)
+
+
+def test_find_contact_pairs_matches_brute_force(contact_backend):
+    rng = np.random.default_rng(0)
+    binder_xyz = _grid_coords(rng, 300)
+    target_xyz = _grid_coords(rng, 200)
+    # Zero-distance pairs: target atoms on top of binder atoms
+    target_xyz[:5] = binder_xyz[:5]
+
+    binder_idx, target_idx = contact_backend.find_contact_pairs(binder_xyz, target_xyz, 5.0)
+    pairs = set(zip(binder_idx.tolist(), target_idx.tolist()))
+
+    assert len(pairs) == len(binder_idx)
+    assert pairs == _brute_force_pairs(binder_xyz, target_xyz, 5.0)
+    assert {(i, i) for i in range(5)} <= pairs
+
+
+@pytest.mark.parametrize("n_binder,n_target", [(0, 4), (4, 0), (0, 0)])
+def test_find_contact_pairs_empty_side(contact_backend, n_binder, n_target):
+    binder_xyz = np.zeros((n_binder, 3), dtype=np.float32)
+    target_xyz = np.zeros((n_target, 3), dtype=np.float32)
+
+    binder_idx, target_idx = contact_backend.find_contact_pairs(binder_xyz, target_xyz)
+
+    assert len(binder_idx) == 0
+    assert len(target_idx) == 0
+
+
+def test_summarize_contacts_collapses_atom_pairs_to_residues(boltz2_app):
+    binder_res = np.array([7, 7, 9, -2], dtype=np.int32)
+    target_res = np.array([100, 100, 300], dtype=np.int32)
+    binder_idx = np.array([0, 1, 1, 3])
+    target_idx = np.array([0, 1, 2, 2])
+
+    num_contacts, binder_residues, target_residues = boltz2_app.summarize_contacts(
+        binder_res, target_res, binder_idx, target_idx
+    )
+
+    # Residue pairs: (7, 100), (7, 300), (-2, 300); residue 9 has no contact
+    assert num_contacts == 3
+    assert binder_residues.tolist() == [-2, 7]
+    assert target_residues.tolist() == [100, 300]
+
+
+def _pdb_atom(chain, res_num, x, y, z):
+    return (
+        f"ATOM  {1:5d}  CA  ALA {chain}{res_num:4d}    "
+        f"{x:8.3f}{y:8.3f}{z:8.3f}  1.00  0.00           C"
+    )
+
+
+def _assert_same_atoms(actual, expected):
+    assert actual["chain"].tolist() == expected["chain"].tolist()
+    assert actual["res_num"].tolist() == expected["res_num"].tolist()
+    assert actual["xyz"].tolist() == expected["xyz"].tolist()
+    assert actual["xyz"].shape == (len(actual["chain"]), 3)
+
+
+@pytest.mark.parametrize(
+    "pdb_content",
+    [
+        # Short records (no occupancy/B-factor, truncated before z) and other records
+        "\n".join([
+            "HEADER    TEST",
+            _pdb_atom("A", 1, 1.0, 2.0, 3.0),
+            _pdb_atom("A", 2, -4.5, 0.25, 10.0)[:54],
+            _pdb_atom("B", 3, 0.0, 0.0, 0.0)[:50],
+            "ATOM",
+            "HETATM    2  O   HOH B  10       0.000   0.000   0.000",
+            _pdb_atom("B", -5, 7.0, 8.0, 9.0),
+        ]),
+        # CRLF line endings (the CR lands in the z column of a 53-character
+        # record), no trailing newline
+        "\r\n".join([
+            _pdb_atom("A", 1, 1.0, 2.0, 3.0),
+            _pdb_atom("A", 2, 1.0, 2.0, 13.0)[:53],
+            _pdb_atom("B", 3, 4.0, 5.0, 6.0),
+        ]),
+        # Malformed coordinate and residue number fields
+        "\n".join([
+            _pdb_atom("A", 1, 1.0, 2.0, 3.0),
+            _pdb_atom("A", 2, 1.0, 2.0, 3.0).replace("   2.000", "   2.0x0"),
+            _pdb_atom("A", 3, 1.0, 2.0, 3.0)[:22] + "  ?3" + _pdb_atom("A", 3, 1.0, 2.0, 3.0)[26:],
+            _pdb_atom("B", 4, 4.0, 5.0, 6.0),
+            "",
+        ]),
+        "",
+    ],
+    ids=["short", "crlf", "malformed", "empty"],
+)
+def test_parse_pdb_atoms_matches_line_parser(boltz2_app, pdb_content):
+    expected = boltz2_app._parse_pdb_atoms_by_line(pdb_content.encode())
+
+    _assert_same_atoms(boltz2_app.parse_pdb_atoms(pdb_content), expected)
+
+
+def test_parse_pdb_atoms_reads_fixed_columns(boltz2_app):
+    pdb_content = "\r\n".join([
+        _pdb_atom("A", 1, 1.0, 2.0, 3.0),
+        _pdb_atom("B", -5, -4.5, 0.25, 10.0)[:54],
+    ])
+
+    atoms = boltz2_app.parse_pdb_atoms(pdb_content)
+
+    assert atoms["chain"].tolist() == ["A", "B"]
+    assert atoms["res_num"].tolist() == [1, -5]
+    assert atoms["xyz"].tolist() == [[1.0, 2.0, 3.0], [-4.5, 0.25, 10.0]]
+
+
+def test_parse_pdb_atoms_skips_malformed_records(boltz2_app):
+    pdb_content = "\n".join([
+        _pdb_atom("A", 1, 1.0, 2.0, 3.0),
+        _pdb_atom("A", 2, 1.0, 2.0, 3.0).replace("   2.000", "   2.0x0"),
+        _pdb_atom("B", 4, 4.0, 5.0, 6.0),
+    ])
+
+    atoms = boltz2_app.parse_pdb_atoms(pdb_content)
+
+    assert atoms["chain"].tolist() == ["A", "B"]
+    assert atoms["res_num"].tolist() == [1, 4]
+
+
+def test_numpy_contacts_match_pdb_utils_copy(boltz2_app):
+    from src.structure import pdb_utils
+
+    rng = np.random.default_rng(1)
+    binder_xyz = _grid_coords(rng, 500)
+    target_xyz = _grid_coords(rng, 300)
+
+    assert boltz2_app.CONTACT_CHUNK_ELEMENTS == pdb_utils.CONTACT_CHUNK_ELEMENTS
+    for actual, expected in zip(
+        boltz2_app._contacts_numpy(binder_xyz, target_xyz, np.float32(25.0)),
+        pdb_utils._find_atom_contacts(binder_xyz, target_xyz, 5.0),
+    ):
+        assert actual.tolist() == expected.tolist()
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+SP34_CIF = REPO_ROOT / "data" / "outputs" / "calibration_cif" / "sp34.cif"
+SCAFFOLD_CIF = REPO_ROOT / "data" / "fab_scaffolds" / "adalimumab.6cr1.cif"
+
+
+def test_boltz_cif_three_letter_codes_are_decoded(boltzgen_app):
+    # Boltz writes "(GLN)(THR)(PRO)..." in pdbx_seq_one_letter_code and all X
+    # in pdbx_seq_one_letter_code_can
+    sequences = boltzgen_app.read_entity_sequences(SP34_CIF.read_text())
+
+    assert sequences["1"].startswith("QTPYKVSISGTTVILTC")
+    assert sequences["1"].endswith("RVCENCM")
+    assert len(sequences["1"]) == 91
+    assert sequences["2"].startswith("QVQLQQPGAELVKPGASVKL")
+    assert all("(" not in seq and "X" not in seq for seq in sequences.values())
+
+
+def test_line_reader_matches_gemmi_on_boltz_and_pdb_cifs(boltzgen_app):
+    for path in (SP34_CIF, SCAFFOLD_CIF):
+        content = path.read_text()
+
+        assert boltzgen_app._read_entity_sequences_by_line(content) == (
+            boltzgen_app.read_entity_sequences(content)
+        )
+
+
+def test_line_reader_indexes_sequence_column_by_position(boltzgen_app):
+    sequences = boltzgen_app._read_entity_sequences_by_line(SCAFFOLD_CIF.read_text())
+
+    assert sequences["1"].startswith("DIQMTQSPSSLSASVGDRVTITC")
+    assert sequences["2"].startswith("EVQLVESGGGLVQPGRSLRLSCAASGFTFDDYAMH")
+
+
+def test_canonical_column_preferred_unless_all_x(boltzgen_app):
+    decode = boltzgen_app.decode_entity_sequence
+
+    assert decode("EVQL(MSE)K", "EVQLMK") == "EVQLMK"
+    assert decode("(GLU)(VAL)\n(GLN)(LEU)", "XX\nXX") == "EVQL"
+    assert decode("EV(UNK)L") == "EVXL"
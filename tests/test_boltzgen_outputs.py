@@ -0,0 +1,59 @@
+def test_design_key_strips_description_and_file_suffix(boltzgen_app):
+    design_key = boltzgen_app.design_key
+
+    assert design_key("design_0001 ipTM=0.81 length=120") == "design_0001"
+    assert design_key("design_0001\tsource=boltzgen") == "design_0001"
+    assert design_key("design_0001.cif") == "design_0001"
+    assert design_key("design_0001.fasta extra") == "design_0001"
+    assert design_key("design_0001") == "design_0001"
+    assert design_key("  ") == ""
+
+
+def test_read_design_metrics_matches_fasta_headers(boltzgen_app, tmp_path):
+    (tmp_path / "metrics.csv").write_text(
+        "\n"
+        "id,design_to_target_iptm,design_ptm\n"
+        "design_0002.cif,0.90,0.80\n"
+        "design_0001,0.70,0.60\n"
+        "design_0003.pdb,0.50\n"
+        "design_0001,0.10,0.10\n"
+    )
+    (tmp_path / "other.csv").write_text(
+        "file_name,design_to_target_iptm\n"
+        "design_0004.fa,0.40\n"
+        "design_0002,0.00\n"
+    )
+
+    metrics = boltzgen_app.read_design_metrics(
+        [tmp_path / "other.csv", tmp_path / "metrics.csv"]
+    )
+
+    # Short rows are skipped; the first row per design wins and metrics.csv is
+    # read before other CSVs
+    assert set(metrics) == {"design_0001", "design_0002", "design_0004"}
+    assert metrics["design_0002"]["design_to_target_iptm"] == "0.90"
+    assert metrics["design_0002"]["_boltzgen_rank"] == 1
+    assert metrics["design_0001"]["design_to_target_iptm"] == "0.70"
+    assert metrics["design_0001"]["_boltzgen_rank"] == 2
+    assert metrics["design_0004"]["_boltzgen_rank"] == 1
+
+    for header in ("design_0001 ipTM=0.70", "design_0002", "design_0004.fa"):
+        assert boltzgen_app.design_key(header) in metrics
+
+
+def test_parse_fasta_joins_multiline_records(boltzgen_app):
+    content = ">design_0001 length=12\nEVQLVE\nSGGGLV\n>design_0002\r\nDIQMTQ\r\n"
+
+    assert boltzgen_app.parse_fasta(content) == [
+        ("design_0001 length=12", "EVQLVESGGGLV"),
+        ("design_0002", "DIQMTQ"),
+    ]
+
+
+def test_parse_fasta_leading_blank_line_and_no_trailing_newline(boltzgen_app):
+    content = "\n>design_0001\nEVQL\n\nVESG\n>empty\n>design_0002\nDIQM"
+
+    assert boltzgen_app.parse_fasta(content) == [
+        ("design_0001", "EVQLVESG"),
+        ("design_0002", "DIQM"),
+    ]
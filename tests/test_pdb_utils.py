@@ -0,0 +1,61 @@
+from src.structure.pdb_utils import (
+    calculate_interface_residues,
+    count_contacts,
+    extract_epitope_from_complex,
+)
+
+
+def _atom(chain, res_num, x, y=0.0, z=0.0, record="ATOM"):
+    return (
+        f"{record:<6}{1:5d}  CA  ALA {chain}{res_num:4d}    "
+        f"{x:8.3f}{y:8.3f}{z:8.3f}  1.00  0.00           C"
+    )
+
+
+# Chain A residues 1-3 and chain B residues 10-13 on the x axis. Contacting
+# residue pairs at 5 Å: (1, 10) twice over, (1, 11), (2, 11) and (3, 13) at
+# exactly the cutoff. B12 is out of range, and the chain B HETATM next to A1
+# must be ignored.
+COMPLEX_PDB = "\n".join([
+    _atom("A", 1, 0.0),
+    _atom("A", 1, 20.0),
+    _atom("A", 2, 10.0),
+    _atom("A", 3, 50.0),
+    _atom("B", 10, 3.0),
+    _atom("B", 10, 0.0, 4.0),
+    _atom("B", 11, 13.0),
+    _atom("B", 11, 17.0),
+    _atom("B", 12, 100.0),
+    _atom("B", 13, 50.0, 5.0),
+    _atom("B", 99, 1.0, record="HETATM"),
+    "END",
+])
+
+
+def test_calculate_interface_residues():
+    interface_a, interface_b = calculate_interface_residues(COMPLEX_PDB, "A", "B")
+
+    assert interface_a == [1, 2, 3]
+    assert interface_b == [10, 11, 13]
+
+
+def test_count_contacts_counts_each_residue_pair_once():
+    assert count_contacts(COMPLEX_PDB, "A", "B") == 4
+    assert count_contacts(COMPLEX_PDB, "A", "B", distance_cutoff=4.0) == 3
+
+
+def test_extract_epitope_from_complex():
+    assert extract_epitope_from_complex(COMPLEX_PDB, "A", ["B"]) == [1, 2, 3]
+    assert extract_epitope_from_complex(COMPLEX_PDB, "A", ["C"]) == []
+
+
+def test_empty_and_hetatm_only_inputs_have_no_contacts():
+    hetatm_only = "\n".join([
+        _atom("A", 1, 0.0, record="HETATM"),
+        _atom("B", 2, 1.0, record="HETATM"),
+    ])
+
+    for pdb_string in ("", hetatm_only):
+        assert calculate_interface_residues(pdb_string, "A", "B") == ([], [])
+        assert count_contacts(pdb_string, "A", "B") == 0
+        assert extract_epitope_from_complex(pdb_string, "A", ["B"]) == []
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+APPS = ["boltzgen_app", "protenix_app"]
+
+
+@pytest.fixture(params=APPS)
+def app_module(request):
+    return request.getfixturevalue(request.param)
+
+
+def test_run_streaming_returns_code_and_output(app_module):
+    cmd = [sys.executable, "-c", "print('line 1'); print('line 2'); raise SystemExit(3)"]
+
+    returncode, output = app_module.run_streaming(cmd, timeout=30)
+
+    assert returncode == 3
+    assert output == "line 1\nline 2\n"
+
+
+def test_run_streaming_raises_on_timeout(app_module):
+    start = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        app_module.run_streaming(["sleep", "30"], timeout=0.2)
+
+    assert time.monotonic() - start < 10
+
+
+def test_run_streaming_timeout_not_lost_to_slow_watchdog(app_module, monkeypatch):
+    # Hold the watchdog thread after the kill, so the main thread is back from
+    # proc.wait() before the watchdog returns
+    killpg = app_module.os.killpg
+
+    def slow_killpg(pgid, sig):
+        killpg(pgid, sig)
+        time.sleep(0.5)
+
+    monkeypatch.setattr(app_module.os, "killpg", slow_killpg)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        app_module.run_streaming(["sleep", "30"], timeout=0.2)